@@ -16,17 +16,20 @@
 import asyncio
 import base64
 import decimal
-import json
 import logging
+import time
+import weakref
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from importlib.resources import files
 from typing import Any
-from uuid import UUID
 
+import orjson
 from mcp.server import FastMCP
 from mcp.types import ToolAnnotations
+from psycopg import sql
 from psycopg.rows import dict_row
+from psycopg.types.json import set_json_loads
 from psycopg_pool import AsyncConnectionPool
 from pydantic import BaseModel, Field
 
@@ -50,6 +53,9 @@ async def create_client(cfg: Config) -> AsyncIterator[AsyncConnectionPool]:
 
     async def configure(conn):
         await conn.set_autocommit(True)
+        # jsonb columns in query results are parsed with orjson rather than
+        # the stdlib json module
+        set_json_loads(orjson.loads, conn)
         logger.debug("Configured new database connection")
 
     try:
@@ -63,7 +69,6 @@ async def create_client(cfg: Config) -> AsyncIterator[AsyncConnectionPool]:
             try:
                 logger.debug("Testing database connection...")
                 async with pool.connection() as conn:
-                    await conn.set_autocommit(True)
                     async with conn.cursor(row_factory=dict_row) as cur:
                         await cur.execute(
                             "SELECT"
@@ -89,7 +94,108 @@ async def create_client(cfg: Config) -> AsyncIterator[AsyncConnectionPool]:
         raise
 
 
+@asynccontextmanager
+async def create_catalog_client(cfg: Config) -> AsyncIterator[AsyncConnectionPool]:
+    """
+    Small pool dedicated to catalog lookups, so listing and describing data
+    products never queues behind long-running user queries on the main pool.
+    """
+
+    async def configure(conn):
+        await conn.set_autocommit(True)
+        set_json_loads(orjson.loads, conn)
+        # Catalog relations are indexed on mz_catalog_server
+        await conn.execute("SET cluster = mz_catalog_server")
+
+    async with AsyncConnectionPool(
+        conninfo=cfg.dsn,
+        min_size=1,
+        max_size=2,
+        kwargs={"application_name": "mcp_materialize_agents"},
+        configure=configure,
+    ) as pool:
+        yield pool
+
+
 TOOL_QUERY = (files("mcp_materialize_agents.sql") / "tools.sql").read_text()
+TOOL_DETAILS_QUERY = TOOL_QUERY + " WHERE object_name = %s"
+
+# JSON Schema for each Materialize column type; anything not listed is a string
+INTEGER_TYPES = {
+    "uint2",
+    "uint4",
+    "uint8",
+    "int",
+    "integer",
+    "smallint",
+    "bigint",
+}
+NUMBER_TYPES = {
+    "double",
+    "double precision",
+    "float",
+    "numeric",
+    "real",
+}
+COLUMN_JSON_SCHEMAS = {
+    "boolean": {"type": "boolean"},
+    "bytea": {
+        "type": "string",
+        "contentEncoding": "base64",
+        "contentMediaType": "application/octet-stream",
+    },
+    "date": {"type": "string", "format": "date"},
+    "time": {"type": "string", "format": "time"},
+    "jsonb": {"type": "object"},
+    "uuid": {"type": "string", "format": "uuid"},
+}
+
+
+def column_json_schema(column_type: str, comment: str | None) -> dict[str, Any]:
+    """JSON Schema for a single column, described by its comment if it has one."""
+    if column_type in INTEGER_TYPES:
+        schema = {"type": "integer"}
+    elif column_type in NUMBER_TYPES:
+        schema = {"type": "number"}
+    elif column_type.lower().startswith("timestamp"):
+        schema = {"type": "string", "format": "date-time"}
+    else:
+        schema = COLUMN_JSON_SCHEMAS.get(column_type, {"type": "string"})
+
+    if comment is not None:
+        schema = {**schema, "description": comment}
+    return schema
+
+
+def input_schema(row: tuple, positions: dict[str, int]) -> dict[str, Any]:
+    """Assemble a data product's JSON Schema from the column arrays of tools.sql."""
+    return {
+        "type": "object",
+        "required": row[positions["required"]] or [],
+        "properties": {
+            name: column_json_schema(column_type, comment)
+            for name, column_type, comment in zip(
+                row[positions["column_names"]],
+                row[positions["column_types"]],
+                row[positions["column_comments"]],
+            )
+        },
+    }
+
+
+# How long data product details are served from memory before the catalog is
+# consulted again; bounds how stale a changed comment or column can be
+DATA_PRODUCT_CACHE_TTL = 60.0
+
+# Cheap probe that changes whenever an index is created or dropped or a comment
+# is added or removed, i.e. whenever the set of data products likely changed.
+# Index oids only ever grow, so a drop followed by a create still moves it.
+CATALOG_VERSION_QUERY = """
+SELECT
+    (SELECT count(*) FROM mz_indexes) AS index_count,
+    (SELECT max(oid) FROM mz_indexes) AS max_index_oid,
+    (SELECT count(*) FROM mz_internal.mz_comments) AS comment_count
+"""
 
 
 class DataProduct(BaseModel):
@@ -145,13 +251,95 @@ class FullDataProduct(BaseModel):
     )
 
 
+def full_data_product(row: tuple, positions: dict[str, int]) -> FullDataProduct:
+    """Details of a data product from its tools.sql catalog row."""
+    return FullDataProduct(
+        name=row[positions["object_name"]],
+        description=row[positions["description"]],
+        cluster=row[positions["cluster"]],
+        schema=input_schema(row, positions),
+    )
+
+
+def is_single_statement(query: str) -> bool:
+    """
+    Whether a query holds at most one SQL statement. A trailing semicolon is
+    fine; semicolons inside quotes and comments don't count.
+    """
+    ended = False
+    i, n = 0, len(query)
+    while i < n:
+        c = query[i]
+        if query.startswith("--", i):
+            end = query.find("\n", i)
+            i = n if end == -1 else end + 1
+        elif query.startswith("/*", i):
+            end = query.find("*/", i + 2)
+            i = n if end == -1 else end + 2
+        elif c == ";":
+            ended = True
+            i += 1
+        elif c.isspace():
+            i += 1
+        elif ended:
+            return False
+        elif c in "'\"":
+            # A doubled quote just closes and reopens the literal
+            end = query.find(c, i + 1)
+            i = n if end == -1 else end + 1
+        else:
+            i += 1
+    return True
+
+
 async def run():
     cfg = load_config()
-    async with create_client(cfg) as mz:
+    async with create_client(cfg) as mz, create_catalog_client(cfg) as catalog:
         server = FastMCP(
             "mcp_materialize", instructions=INSTRUCTIONS, host=cfg.host, port=cfg.port
         )
 
+        # name -> (fetched_at, details), shared by both catalog tools so that
+        # details for a product that was just listed don't hit the catalog again.
+        # Listings store the raw catalog row; its schema is only assembled if
+        # the details are actually asked for.
+        details_cache: dict[str, tuple[float, tuple | FullDataProduct]] = {}
+        details_lock = asyncio.Lock()
+        # Cluster each pooled connection's session is known to be set to, so
+        # repeated queries on the same cluster skip the SET. Entries vanish
+        # with the connection when the pool replaces it.
+        session_clusters: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        # cluster -> composed SET statement, quoted once per distinct cluster
+        set_cluster_statements: dict[str, sql.Composed] = {}
+        # (catalog version, fetched_at, data products) of the last listing
+        listing: tuple[tuple, float, list[DataProduct]] | None = None
+        # Column name -> position in tools.sql rows. The result shape is fixed,
+        # so rows are fetched as plain tuples and indexed through this mapping.
+        tool_columns: dict[str, int] = {}
+
+        def column_positions(cur) -> dict[str, int]:
+            if not tool_columns:
+                tool_columns.update(
+                    {column.name: i for i, column in enumerate(cur.description)}
+                )
+            return tool_columns
+
+        def cached_details(name: str) -> FullDataProduct | None:
+            entry = details_cache.get(name)
+            if entry is None:
+                return None
+            fetched_at, details = entry
+            if time.monotonic() - fetched_at > DATA_PRODUCT_CACHE_TTL:
+                del details_cache[name]
+                return None
+            if not isinstance(details, FullDataProduct):
+                details = full_data_product(details, tool_columns)
+                details_cache[name] = (fetched_at, details)
+            return details
+
+        def cache_row(row: tuple) -> None:
+            details_cache[row[tool_columns["object_name"]]] = (time.monotonic(), row)
+
         @server.tool(
             description=(
                 "Discover all available real-time data views (data products) "
@@ -163,20 +351,44 @@ async def run():
             annotations=ToolAnnotations(readOnlyHint=True),
         )
         async def get_data_products() -> list[DataProduct]:
-            async with mz.connection() as conn:
-                conn.set_autocommit(True)
-                async with conn.cursor(row_factory=dict_row) as cur:
-                    await cur.execute(TOOL_QUERY)
-                    data_products = []
-                    async for row in cur:
-                        data_products.append(
-                            DataProduct(
-                                name=row["object_name"],
-                                cluster=row["cluster"],
-                                description=row["description"],
-                            )
-                        )
-                    return data_products
+            nonlocal listing
+            async with catalog.connection() as conn:
+                async with conn.cursor() as cur:
+                    await cur.execute(CATALOG_VERSION_QUERY, prepare=True)
+                    version = await cur.fetchone()
+
+                    # Reuse the last listing while the catalog looks unchanged;
+                    # the TTL still bounds staleness of edited comments
+                    if listing is not None:
+                        listed_version, listed_at, listed = listing
+                        if (
+                            listed_version == version
+                            and time.monotonic() - listed_at <= DATA_PRODUCT_CACHE_TTL
+                        ):
+                            return list(listed)
+
+                    # The catalog query text never changes, so have the server
+                    # keep its plan instead of re-planning every listing
+                    await cur.execute(TOOL_QUERY, prepare=True)
+                    rows = await cur.fetchall()
+                    positions = column_positions(cur)
+
+            # Build the models after the connection is back in the pool
+            name_at = positions["object_name"]
+            cluster_at = positions["cluster"]
+            description_at = positions["description"]
+            data_products = []
+            for row in rows:
+                cache_row(row)
+                data_products.append(
+                    DataProduct(
+                        name=row[name_at],
+                        cluster=row[cluster_at],
+                        description=row[description_at],
+                    )
+                )
+            listing = (version, time.monotonic(), data_products)
+            return list(data_products)
 
         @server.tool(
             description=(
@@ -196,18 +408,24 @@ async def run():
                 )
             ),
         ) -> FullDataProduct:
-            async with mz.connection() as conn:
-                conn.set_autocommit(True)
-                async with conn.cursor(row_factory=dict_row) as cur:
-                    await cur.execute(TOOL_QUERY + " WHERE object_name = %s", [name])
-                    async for row in cur:
-                        return FullDataProduct(
-                            name=row["object_name"],
-                            description=row["description"],
-                            cluster=row["cluster"],
-                            schema=row["schema"],
-                        )
-                raise ValueError("Unknown data product name")
+            details = cached_details(name)
+            if details is not None:
+                return details
+
+            async with details_lock:
+                # Another call may have fetched it while we waited
+                details = cached_details(name)
+                if details is not None:
+                    return details
+
+                async with catalog.connection() as conn:
+                    async with conn.cursor() as cur:
+                        await cur.execute(TOOL_DETAILS_QUERY, [name], prepare=True)
+                        column_positions(cur)
+                        async for row in cur:
+                            cache_row(row)
+                            return cached_details(name)
+                    raise ValueError("Unknown data product name")
 
         @server.tool(
             description=(
@@ -233,19 +451,55 @@ async def run():
                     "PostgreSQL-compatible SELECT statement to retrieve data. "
                     "Use the fully qualified data product name exactly as "
                     "provided (with double quotes). You can JOIN multiple data "
-                    "products, but only those on the same cluster."
+                    "products, but only those on the same cluster. Exactly one "
+                    "statement; several semicolon-separated statements are not "
+                    "supported."
                 )
             ),
         ):
+            # The query goes through the extended protocol inside the
+            # pipeline, which only accepts a single statement
+            if not is_single_statement(sql_query):
+                raise ValueError(
+                    "sql_query must be a single SQL statement; run several "
+                    "statements as separate queries"
+                )
+
             async with mz.connection() as conn:
-                conn.set_autocommit(True)
-                async with conn.cursor(row_factory=dict_row) as cur:
-                    cur.execute("START TRANSACTION READ ONLY;")
-                    await cur.execute(f"SET cluster TO {cluster};")
-                    await cur.execute(sql_query)
+                # Forget the session's cluster until this round trip succeeds;
+                # a failed pipeline may have rolled the SET back
+                needs_set = session_clusters.pop(conn, None) != cluster
+                async with (
+                    conn.cursor(row_factory=dict_row) as cur,
+                    conn.cursor() as cluster_cur,
+                ):
+                    # Pick the cluster before opening the read-only transaction,
+                    # and send the setup, the query and the COMMIT as a single
+                    # pipeline so they cost one round trip to Materialize
+                    async with conn.pipeline():
+                        if needs_set:
+                            stmt = set_cluster_statements.get(cluster)
+                            if stmt is None:
+                                stmt = set_cluster_statements.setdefault(
+                                    cluster,
+                                    sql.SQL("SET cluster TO {}").format(
+                                        sql.Identifier(cluster)
+                                    ),
+                                )
+                            await conn.execute(stmt)
+                        await conn.execute("START TRANSACTION READ ONLY")
+                        await cur.execute(sql_query)
+                        await conn.execute("COMMIT")
+                        # Read the session's cluster back in the same round
+                        # trip rather than assuming it, since the query itself
+                        # may have been a SET cluster
+                        await cluster_cur.execute("SHOW cluster")
 
                     rows = await cur.fetchall()
-                    return serialize(rows)
+                    (session_cluster,) = await cluster_cur.fetchone()
+
+                session_clusters[conn] = session_cluster
+                return serialize(rows)
 
         match cfg.transport:
             case "stdio":
@@ -260,28 +514,25 @@ async def run():
 
 def serialize(obj):
     """Serialize any Decimal/date/bytes/UUID into JSON-safe primitives."""
-    # json.dumps will call json_serial for any non-standard type,
-    # then json.loads turns it back into a Python dict/list of primitives.
+    # orjson.dumps will call json_serial for any type it can't encode natively
+    # (datetimes and UUIDs it handles itself), then orjson.loads turns it back
+    # into a Python dict/list of primitives.
     # Structured output types require the tool returns dict[str, Any]
     # but the json encoder used by the mcp library does not support all
     # standard postgres types
-    return json.loads(json.dumps(obj, default=json_serial))
+    return orjson.loads(orjson.dumps(obj, default=json_serial))
 
 
 def json_serial(obj):
-    """JSON serializer for objects not serializable by default json code"""
-    from datetime import date, datetime, time, timedelta
+    """JSON serializer for objects not serializable natively by orjson"""
+    from datetime import timedelta
 
-    if isinstance(obj, datetime | date | time):
-        return obj.isoformat()
-    elif isinstance(obj, timedelta):
+    if isinstance(obj, timedelta):
         return obj.total_seconds()
     elif isinstance(obj, bytes):
         return base64.b64encode(obj).decode("ascii")
     elif isinstance(obj, decimal.Decimal):
         return float(obj)
-    elif isinstance(obj, UUID):
-        return str(obj)
     else:
         raise TypeError(f"Type {type(obj)} not serializable. This is a bug.")
 
@@ -23,93 +23,69 @@
 --   1. Builds a unique tool name based on the database, schema, and index name.
 --   2. Gathers privileges to ensure only SELECT- and USAGE-permitted objects are included.
 --   3. Retrieves object and column comments to annotate the tool with human-readable descriptions.
---   4. Constructs a JSON Schema for the tool’s input parameters (key columns) with
---      appropriate types (number, string, boolean, date, etc.) and descriptions.
---   5. Lists the remaining indexed columns as the tool’s output values.
+--   4. Lists the object's columns, their types and comments as parallel arrays, along
+--      with the indexed key columns, from which the server builds the tool's JSON Schema.
 --
 -- The final output is one row per index containing:
---   - name:          Unique MCP tool identifier
---   - database:      Origin database name
---   - schema:        Origin schema name
---   - object_name:   Underlying table or view name
---   - cluster:       Materialize cluster hosting the index
---   - description:   Object-level comment used as the tool description
---   - input_schema: JSON Schema object defining required input fields
---   - output_columns: Array of non-key columns returned by the tool
+--   - object_name:     Fully qualified, quoted name of the underlying table or view
+--   - cluster:         Materialize cluster hosting the index
+--   - description:     Object-level comment used as the tool description
+--   - required:        Names of the indexed key columns
+--   - column_names:    Column names, in column order
+--   - column_types:    Column types, aligned with column_names
+--   - column_comments: Column comments (or NULL), aligned with column_names
 --
-WITH tools AS (
-    SELECT
+WITH data_products AS (
+    SELECT DISTINCT
+        o.id,
+        c.id AS cluster_id,
         '"' || op.database || '"."' || op.schema || '"."' || op.name || '"' AS object_name,
         c.name AS cluster,
-        cts.comment AS description,
-        jsonb_build_object(
-            'type', 'object',
-            'required', jsonb_agg(distinct ccol.name) FILTER (WHERE ccol.position = ic.on_position),
-            'properties', jsonb_strip_nulls(jsonb_object_agg(
-                ccol.name,
-                CASE
-                    WHEN ccol.type IN (
-                        'uint2', 'uint4','uint8', 'int', 'integer', 'smallint',
-                        'double', 'double precision', 'bigint', 'float',
-                        'numeric', 'real'
-                    ) THEN jsonb_build_object(
-                        'type', 'number',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type = 'boolean' THEN jsonb_build_object(
-                        'type', 'boolean',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type = 'bytea' THEN jsonb_build_object(
-                        'type', 'string',
-                        'description', cts_col.comment,
-                        'contentEncoding', 'base64',
-                        'contentMediaType', 'application/octet-stream'
-                    )
-                    WHEN ccol.type = 'date' THEN jsonb_build_object(
-                        'type', 'string',
-                        'format', 'date',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type = 'time' THEN jsonb_build_object(
-                        'type', 'string',
-                        'format', 'time',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type ilike 'timestamp%%' THEN jsonb_build_object(
-                        'type', 'string',
-                        'format', 'date-time',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type = 'jsonb' THEN jsonb_build_object(
-                        'type', 'object',
-                        'description', cts_col.comment
-                    )
-                    WHEN ccol.type = 'uuid' THEN jsonb_build_object(
-                        'type', 'string',
-                        'format', 'uuid',
-                        'description', cts_col.comment
-                    )
-                    ELSE jsonb_build_object(
-                        'type', 'string',
-                        'description', cts_col.comment
-                    )
-                END
-            ))
-        ) AS schema
+        cts.comment AS description
     FROM mz_internal.mz_show_my_object_privileges op
     JOIN mz_objects o ON op.name = o.name AND op.object_type = o.type
     JOIN mz_schemas s ON s.name = op.schema AND s.id = o.schema_id
     JOIN mz_databases d ON d.name = op.database AND d.id = s.database_id
     JOIN mz_indexes i ON i.on_id = o.id
-    JOIN mz_index_columns ic ON i.id = ic.index_id
-    JOIN mz_columns ccol ON ccol.id = o.id
     JOIN mz_clusters c ON c.id = i.cluster_id
     JOIN mz_internal.mz_show_my_cluster_privileges cp ON cp.name = c.name
     JOIN mz_internal.mz_comments cts ON cts.id = o.id AND cts.object_sub_id IS NULL
-    LEFT JOIN mz_internal.mz_comments cts_col ON cts_col.id = o.id AND cts_col.object_sub_id = ccol.position
     WHERE op.privilege_type = 'SELECT'
       AND cp.privilege_type = 'USAGE'
-    GROUP BY 1,2,3
+),
+columns AS (
+    SELECT
+        ccol.id,
+        array_agg(ccol.name ORDER BY ccol.position) AS column_names,
+        array_agg(ccol.type ORDER BY ccol.position) AS column_types,
+        array_agg(cts_col.comment ORDER BY ccol.position) AS column_comments
+    FROM mz_columns ccol
+    LEFT JOIN mz_internal.mz_comments cts_col ON cts_col.id = ccol.id AND cts_col.object_sub_id = ccol.position
+    WHERE ccol.id IN (SELECT id FROM data_products)
+    GROUP BY ccol.id
+),
+keys AS (
+    SELECT
+        i.on_id AS id,
+        i.cluster_id,
+        array_agg(DISTINCT ccol.name) AS required
+    FROM mz_indexes i
+    JOIN mz_index_columns ic ON i.id = ic.index_id
+    JOIN mz_columns ccol ON ccol.id = i.on_id AND ccol.position = ic.on_position
+    WHERE i.on_id IN (SELECT id FROM data_products)
+    GROUP BY i.on_id, i.cluster_id
+),
+tools AS (
+    SELECT
+        dp.object_name,
+        dp.cluster,
+        dp.description,
+        k.required,
+        col.column_names,
+        col.column_types,
+        col.column_comments
+    FROM data_products dp
+    JOIN columns col ON col.id = dp.id
+    LEFT JOIN keys k ON k.id = dp.id AND k.cluster_id = dp.cluster_id
 )
 SELECT * FROM tools
@@ -0,0 +1,118 @@
+import pytest
+
+from mcp_materialize_agents import column_json_schema, input_schema
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    ["uint2", "uint4", "uint8", "int", "integer", "smallint", "bigint"],
+)
+def test_integer_types(column_type):
+    assert column_json_schema(column_type, None) == {"type": "integer"}
+
+
+@pytest.mark.parametrize(
+    "column_type", ["double", "double precision", "float", "numeric", "real"]
+)
+def test_number_types(column_type):
+    assert column_json_schema(column_type, None) == {"type": "number"}
+
+
+@pytest.mark.parametrize(
+    "column_type",
+    [
+        "timestamp",
+        "timestamp with time zone",
+        "timestamp without time zone",
+        "TIMESTAMPTZ",
+    ],
+)
+def test_timestamp_prefix(column_type):
+    assert column_json_schema(column_type, None) == {
+        "type": "string",
+        "format": "date-time",
+    }
+
+
+@pytest.mark.parametrize(
+    "column_type, schema",
+    [
+        ("boolean", {"type": "boolean"}),
+        (
+            "bytea",
+            {
+                "type": "string",
+                "contentEncoding": "base64",
+                "contentMediaType": "application/octet-stream",
+            },
+        ),
+        ("date", {"type": "string", "format": "date"}),
+        ("time", {"type": "string", "format": "time"}),
+        ("jsonb", {"type": "object"}),
+        ("uuid", {"type": "string", "format": "uuid"}),
+        ("text", {"type": "string"}),
+        ("character varying", {"type": "string"}),
+        ("interval", {"type": "string"}),
+    ],
+)
+def test_other_types(column_type, schema):
+    assert column_json_schema(column_type, None) == schema
+
+
+def test_comment_becomes_description():
+    assert column_json_schema("bigint", "Customer id") == {
+        "type": "integer",
+        "description": "Customer id",
+    }
+    assert column_json_schema("date", "Order date") == {
+        "type": "string",
+        "format": "date",
+        "description": "Order date",
+    }
+
+
+def test_comment_does_not_leak_into_shared_schemas():
+    column_json_schema("uuid", "First")
+    assert column_json_schema("uuid", None) == {"type": "string", "format": "uuid"}
+
+
+POSITIONS = {
+    "object_name": 0,
+    "required": 1,
+    "column_names": 2,
+    "column_types": 3,
+    "column_comments": 4,
+}
+
+
+def test_input_schema():
+    row = (
+        '"materialize"."public"."orders"',
+        ["id"],
+        ["id", "total", "placed_at"],
+        ["bigint", "numeric", "timestamp with time zone"],
+        ["Order id", None, "When the order was placed"],
+    )
+    assert input_schema(row, POSITIONS) == {
+        "type": "object",
+        "required": ["id"],
+        "properties": {
+            "id": {"type": "integer", "description": "Order id"},
+            "total": {"type": "number"},
+            "placed_at": {
+                "type": "string",
+                "format": "date-time",
+                "description": "When the order was placed",
+            },
+        },
+    }
+
+
+def test_input_schema_without_keys():
+    # A product whose index has no key columns gets NULL from the catalog
+    row = ('"materialize"."public"."totals"', None, ["total"], ["numeric"], [None])
+    assert input_schema(row, POSITIONS) == {
+        "type": "object",
+        "required": [],
+        "properties": {"total": {"type": "number"}},
+    }
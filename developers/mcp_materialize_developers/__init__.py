@@ -11,6 +11,12 @@ import logging
 import sys
 from typing import Optional
 
+try:
+    # Optional faster event loop (the "uvloop" extra); not available on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from .mcp_server import MaterializeDevMcpServer
 from .config import load_config, ConfigurationError
 from .logging_config import setup_structured_logging
@@ -59,7 +65,7 @@ def main():
     global logger
 
     try:
-        asyncio.run(run())
+        asyncio.run(run(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         if logger:
             logger.info("Received shutdown signal, stopping server gracefully")
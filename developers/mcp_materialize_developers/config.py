@@ -27,6 +27,9 @@ class Config:
     version: str
     s3_bucket_name: str
     mode: str
+    embedding_backend: str = "torch"
+    local_vector_index: bool = False
+    semantic_search_cache: bool = False
 
     def validate(self) -> None:
         """Validate the configuration settings."""
@@ -109,6 +112,13 @@ class Config:
         if self.mode.upper() not in valid_modes:
             errors.append(f"mode must be one of: {', '.join(valid_modes)}")
 
+        # Validate embedding backend
+        valid_backends = ["torch", "onnx"]
+        if self.embedding_backend not in valid_backends:
+            errors.append(
+                f"embedding_backend must be one of: {', '.join(valid_backends)}"
+            )
+
         if errors:
             raise ValidationError("configuration", "; ".join(errors))
 
@@ -132,6 +142,9 @@ Environment Variables:
   MCP_VERSION            Service version
   S3_BUCKET_NAME         S3 bucket name for documentation vectors
   MCP_MODE               Server mode (READ_WRITE|READ_ONLY|DOCS_ONLY)
+  MCP_EMBEDDING_BACKEND  Embedding backend for documentation search (torch|onnx)
+  MCP_LOCAL_VECTOR_INDEX Search documentation from an in-memory index (true|false)
+  MCP_SEMANTIC_SEARCH_CACHE Reuse results of similar documentation searches (true|false)
 """,
     )
     parser.add_argument(
@@ -165,8 +178,8 @@ Environment Variables:
     parser.add_argument(
         "--pool-min-size",
         type=int,
-        default=_safe_int(os.getenv("MCP_POOL_MIN_SIZE", "1")),
-        help="Minimum connection pool size (default: 1)",
+        default=_safe_int(os.getenv("MCP_POOL_MIN_SIZE", "2")),
+        help="Minimum connection pool size (default: 2)",
     )
 
     parser.add_argument(
@@ -215,6 +228,27 @@ Environment Variables:
         help="Server mode: READ_WRITE allows introspecting and modifying Materialize database, READ_ONLY allows introspecting only, DOCS_ONLY provides documentation without database connection (default: READ_WRITE)",
     )
 
+    parser.add_argument(
+        "--embedding-backend",
+        choices=["torch", "onnx"],
+        default=os.getenv("MCP_EMBEDDING_BACKEND", "torch").lower(),
+        help="Embedding backend for documentation search: torch runs the PyTorch model, onnx runs the int8 quantized ONNX export through ONNX Runtime (requires the onnx extra) (default: torch)",
+    )
+
+    parser.add_argument(
+        "--local-vector-index",
+        action="store_true",
+        default=_safe_bool(os.getenv("MCP_LOCAL_VECTOR_INDEX", "false")),
+        help="Load the documentation vectors into memory on first search and query them locally instead of calling S3 Vectors per search (default: false)",
+    )
+
+    parser.add_argument(
+        "--semantic-search-cache",
+        action="store_true",
+        default=_safe_bool(os.getenv("MCP_SEMANTIC_SEARCH_CACHE", "false")),
+        help="Answer a documentation search from the cached results of a recent search whose query embedding is nearly identical (cosine similarity >= 0.95) (default: false)",
+    )
+
     try:
         args = parser.parse_args()
     except SystemExit as e:
@@ -239,6 +273,9 @@ Environment Variables:
             version=args.version,
             s3_bucket_name=args.s3_bucket_name,
             mode=args.mode.upper(),
+            embedding_backend=args.embedding_backend.lower(),
+            local_vector_index=args.local_vector_index,
+            semantic_search_cache=args.semantic_search_cache,
         )
 
         # Validate the configuration
@@ -1,3 +1,6 @@
+import asyncio
+import contextlib
+
 from mcp.server import FastMCP
 from psycopg_pool import AsyncConnectionPool
 
@@ -36,6 +39,31 @@ class MaterializeDevMcpServer:
         )
         await self._pool.__aenter__()
 
+        # Loading the embedding model and checking the vector bucket blocks for
+        # a while, so do it on a worker thread while the pool connects
+        search_documentation = asyncio.create_task(
+            asyncio.to_thread(
+                SearchDocumentation,
+                bucket_name=self._cfg.s3_bucket_name,
+                embedding_backend=self._cfg.embedding_backend,
+                local_index=self._cfg.local_vector_index,
+                semantic_cache=self._cfg.semantic_search_cache,
+            )
+        )
+
+        if self._cfg.mode != "DOCS_ONLY":
+            # Establish min_size connections up front so the first tool calls
+            # don't pay connection setup (TLS + auth) on the hot path
+            try:
+                await self._pool.wait(timeout=10.0)
+            except BaseException:
+                # Don't leave the search tool loading behind a failed start
+                search_documentation.cancel()
+                with contextlib.suppress(BaseException):
+                    await search_documentation
+                await self._pool.close()
+                raise
+
         if self._cfg.mode == "READ_WRITE":
             self._server.add_tool(ExecuteDDL(self._pool))
 
@@ -44,11 +72,18 @@ class MaterializeDevMcpServer:
             self._server.add_tool(MonitorDataFreshness(self._pool))
             self._server.add_tool(ObjectFreshnessDiagnostics(self._pool))
 
-        self._server.add_tool(SearchDocumentation())
+        search_documentation = await search_documentation
+        # Kept to close its vector store client, HTTP session and encode
+        # executor on exit
+        self._searcher = search_documentation.searcher
+        self._server.add_tool(search_documentation)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self._pool.__aexit__(exc_type, exc_val, exc_tb)
+        try:
+            await self._searcher.aclose()
+        finally:
+            await self._pool.__aexit__(exc_type, exc_val, exc_tb)
 
     async def run(self):
         match self._cfg.transport:
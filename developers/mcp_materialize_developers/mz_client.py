@@ -627,7 +627,7 @@ class MzClient:
                 LEFT JOIN mz_clusters c ON o.cluster_id = c.id
                 WHERE f.write_frontier > 0
                   AND mz_now() > to_timestamp(f.write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                  AND f.object_id LIKE 'u%%'
+                  AND f.object_id >= 'u' AND f.object_id < 'v'
                 """
 
                 params = [threshold_seconds]
@@ -670,7 +670,7 @@ class MzClient:
                     FROM mz_internal.mz_frontiers
                     WHERE write_frontier > 0
                       AND mz_now() > to_timestamp(write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                      AND object_id LIKE 'u%%'
+                      AND object_id >= 'u' AND object_id < 'v'
                 ),
                 depends_on(probe text, prev text, next text) AS (
                     SELECT id, id, id FROM probes
@@ -720,7 +720,7 @@ class MzClient:
                     FROM mz_internal.mz_frontiers
                     WHERE write_frontier > 0
                       AND mz_now() > to_timestamp(write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                      AND object_id LIKE 'u%%'
+                      AND object_id >= 'u' AND object_id < 'v'
                 ),
                 depends_on(probe text, prev text, next text) AS (
                     SELECT id, id, id FROM probes
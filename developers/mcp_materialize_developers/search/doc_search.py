@@ -3,84 +3,263 @@ Documentation search module for semantic search over Materialize documentation.
 Uses S3-based vector storage for sharing across MCP servers.
 """
 
+import asyncio
+import functools
 import logging
+import re
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 
 import aiohttp
+import numpy as np
 from bs4 import BeautifulSoup
 
+from .page_cache import PageCache
 from .s3_vector_bucket_store import S3VectorBucketStore
 
 logger = logging.getLogger(__name__)
 
+# Number of documentation pages fetched at once while scraping
+SCRAPE_CONCURRENCY = 20
+
+# Upper bound on how many page requests the scraper starts per second, to stay
+# clear of rate limiting on materialize.com
+SCRAPE_REQUESTS_PER_SECOND = 10.0
+
+# Pages are cut off after this many bytes so one huge response can't blow up
+# the crawler's memory
+MAX_PAGE_BYTES = 2_000_000
+
+# Links containing any of these are not documentation pages worth crawling
+_SKIP_LINK_RE = re.compile(r"mailto:|tel:|\.pdf|\.zip")
+
+# Elements that hold a page's documentation content, tried before <body>
+_CONTENT_SELECTOR = "main, article, div.content, div.documentation"
+
+# Any run of whitespace in extracted page text collapses to a single space
+_WS_RE = re.compile(r"\s+")
+
+# Number of recent searches whose query embeddings the semantic cache compares
+# new queries against
+SEMANTIC_CACHE_SIZE = 256
+
+
+def _normalize_url(url: str) -> str:
+    """Canonical form of a documentation URL, so each page is crawled once.
+
+    Drops the fragment and query string, lowercases the scheme and host, and
+    maps ``.../index.html`` and slash-less directory paths onto the trailing
+    slash form the docs site serves its pages under.
+    """
+    parts = urlsplit(url)
+    path = parts.path
+    if path.endswith("/index.html"):
+        path = path[: -len("index.html")]
+    elif not path.endswith("/") and "." not in path.rsplit("/", 1)[-1]:
+        path += "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, "", ""))
+
+
+@functools.lru_cache(maxsize=1024)
+def _section_title(slug: str) -> str:
+    """Title for a URL path segment, e.g. "create-view" -> "Create View".
+
+    Every page under a section shares these segments, so the titles are
+    cached per segment rather than recomputed per page.
+    """
+    return slug.replace("-", " ").title()
+
+
+class _RateLimiter:
+    """Spaces out callers so that at most ``rate`` of them proceed per second."""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def wait(self):
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class DocumentationSearcher:
     """Handles semantic search over Materialize documentation using S3 Vector Buckets."""
 
     def __init__(
-        self, bucket_name: str = "materialize-docs-vectors", region: str = "us-east-1"
+        self,
+        bucket_name: str = "materialize-docs-vectors",
+        region: str = "us-east-1",
+        embedding_backend: str = "torch",
+        local_index: bool = False,
+        cache_maxsize: int = 512,
+        cache_ttl: float = 300,
+        semantic_cache: bool = False,
+        semantic_cache_threshold: float = 0.95,
+        requests_per_second: float = SCRAPE_REQUESTS_PER_SECOND,
+        page_cache_path: Optional[str] = None,
+        s3_store: Optional[S3VectorBucketStore] = None,
     ):
         self.bucket_name = bucket_name
         self.region = region
-        self.s3_store = S3VectorBucketStore(bucket_name=bucket_name, region=region)
+        # A store passed in is shared with the caller, who also closes it;
+        # this avoids loading a second copy of the embedding model
+        self._owns_s3_store = s3_store is None
+        self.s3_store = s3_store or S3VectorBucketStore(
+            bucket_name=bucket_name,
+            region=region,
+            embedding_backend=embedding_backend,
+            local_index=local_index,
+        )
         self.base_url = "https://materialize.com/docs/"
 
-    async def scrape_documentation(self, max_pages: int = 200):
-        """Scrape Materialize documentation and store in S3 Vector Buckets."""
-        logger.info(f"Starting documentation scrape (max {max_pages} pages)")
-
-        scraped_docs = []
-        async for doc_batch in self._scrape_documentation_generator(max_pages):
-            scraped_docs.extend(doc_batch)
-
-        # Bulk add all documents to S3 Vector Buckets
-        if scraped_docs:
-            await self.s3_store.bulk_add_documents(scraped_docs)
+        # HTTP session for scraping, created on first use and kept for the
+        # searcher's lifetime so connections and DNS lookups are reused
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._rate_limiter = _RateLimiter(requests_per_second)
+        # Optional on-disk copy of previously scraped pages, revalidated with
+        # If-None-Match / If-Modified-Since instead of being downloaded again
+        self._page_cache: Optional[PageCache] = (
+            PageCache(page_cache_path) if page_cache_path else None
+        )
 
-        logger.info(f"Scraping completed. Processed {len(scraped_docs)} pages")
+        # (query, limit, section_filter) -> (expires_at, results), oldest first
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_maxsize = cache_maxsize
+        self._cache_ttl = cache_ttl
+        self._cache_lock = asyncio.Lock()
+        # Searches currently running, so concurrent misses on the same key
+        # share one embed + query_vectors round trip
+        self._inflight: dict = {}
+        # Bumped whenever the documentation changes, so searches that started
+        # before then don't repopulate the cache with stale results
+        self._cache_generation = 0
+
+        # Optional second level: results of recent searches keyed like _cache,
+        # holding (expires_at, unit query embedding, results). A query whose
+        # embedding is close enough to a cached one reuses its results.
+        self._semantic_cache: Optional[OrderedDict] = (
+            OrderedDict() if semantic_cache else None
+        )
+        self._semantic_cache_threshold = semantic_cache_threshold
 
-    async def _scrape_documentation_generator(
-        self, max_pages: int = 200, batch_size: int = 10
+    async def scrape_documentation(
+        self, max_pages: int = 200, max_pending_batches: int = 4
     ):
-        """Generator that yields batches of scraped documents."""
-        logger.info(f"Starting documentation scrape (max {max_pages} pages)")
+        """Scrape Materialize documentation and store in S3 Vector Buckets.
+
+        Each batch is embedded and uploaded while the crawl carries on, with at
+        most ``max_pending_batches`` batches in flight so a slow upload holds
+        back the scraper instead of piling pages up in memory.
+        """
+        logger.info("Starting documentation scrape (max %d pages)", max_pages)
 
-        visited_urls = set()
-        to_visit = [self.base_url]
-        scraped_docs = []
         total_scraped = 0
+        pending = asyncio.Semaphore(max_pending_batches)
 
-        async with aiohttp.ClientSession() as session:
-            while to_visit and total_scraped < max_pages:
-                url = to_visit.pop(0)
-                if url in visited_urls:
-                    continue
+        async def add_batch(doc_batch: List[Dict[str, Any]]):
+            try:
+                await self.s3_store.bulk_add_documents(doc_batch)
+            finally:
+                pending.release()
+
+        async with asyncio.TaskGroup() as tg:
+            async for doc_batch in self._scrape_documentation_generator(max_pages):
+                await pending.acquire()
+                tg.create_task(add_batch(doc_batch))
+                total_scraped += len(doc_batch)
 
-                visited_urls.add(url)
+        self.clear_cache()
+        logger.info("Scraping completed. Processed %d pages", total_scraped)
 
+    async def _scrape_documentation_generator(
+        self,
+        max_pages: int = 200,
+        batch_size: int = 10,
+        concurrency: int = SCRAPE_CONCURRENCY,
+    ):
+        """Generator that yields batches of scraped documents.
+
+        Pages are fetched by ``concurrency`` workers sharing one session, so
+        the crawl is bounded by the slowest pages rather than the sum of all
+        round trips.
+        """
+        logger.info("Starting documentation scrape (max %d pages)", max_pages)
+
+        # Every URL ever put on the queue, so each page is queued (and thus
+        # fetched) at most once no matter how many pages link to it
+        queued_urls = {self.base_url}
+        to_visit: asyncio.Queue[str] = asyncio.Queue()
+        to_visit.put_nowait(self.base_url)
+        # Scraped documents handed from the workers to the generator; None
+        # marks the end of the crawl
+        scraped: asyncio.Queue[Optional[Dict[str, Any]]] = asyncio.Queue()
+        limit_reached = asyncio.Event()
+        total_scraped = 0
+
+        async def worker(session: aiohttp.ClientSession):
+            nonlocal total_scraped
+            while True:
+                url = await to_visit.get()
                 try:
-                    logger.debug(f"Scraping: {url}")
-                    doc_data = await self._scrape_page(session, url)
+                    if limit_reached.is_set():
+                        continue
+
+                    logger.debug("Scraping: %s", url)
+                    doc_data, new_links = await self._scrape_page(session, url)
 
-                    if doc_data:
-                        scraped_docs.append(doc_data)
+                    if doc_data and not limit_reached.is_set():
+                        scraped.put_nowait(doc_data)
                         total_scraped += 1
+                        if total_scraped >= max_pages:
+                            limit_reached.set()
 
                         # Find more links to scrape
-                        new_links = await self._extract_doc_links(session, url)
                         for link in new_links:
-                            if link not in visited_urls and link not in to_visit:
-                                to_visit.append(link)
-
-                        # Yield batch when we have enough documents
-                        if len(scraped_docs) >= batch_size:
-                            yield scraped_docs
-                            scraped_docs = []
+                            if link not in queued_urls:
+                                queued_urls.add(link)
+                                to_visit.put_nowait(link)
 
                 except Exception as e:
-                    logger.error(f"Error scraping {url}: {e}")
-                    continue
+                    logger.error("Error scraping %s: %s", url, e)
+                finally:
+                    to_visit.task_done()
+
+        async def crawl(session: aiohttp.ClientSession):
+            workers = [asyncio.create_task(worker(session)) for _ in range(concurrency)]
+            # Stop once every queued link has been handled or enough pages
+            # were scraped, whichever comes first
+            waiters = [
+                asyncio.create_task(to_visit.join()),
+                asyncio.create_task(limit_reached.wait()),
+            ]
+            try:
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                tasks = workers + waiters
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                scraped.put_nowait(None)
+
+        scraped_docs = []
+        crawler = asyncio.create_task(crawl(self._get_session()))
+        try:
+            while (doc_data := await scraped.get()) is not None:
+                scraped_docs.append(doc_data)
+
+                # Yield batch when we have enough documents
+                if len(scraped_docs) >= batch_size:
+                    yield scraped_docs
+                    scraped_docs = []
+        finally:
+            # Also stops the workers if the consumer stops iterating early
+            crawler.cancel()
+            await asyncio.gather(crawler, return_exceptions=True)
 
         # Yield remaining documents
         if scraped_docs:
@@ -88,54 +267,117 @@ class DocumentationSearcher:
 
     async def _scrape_page(
         self, session: aiohttp.ClientSession, url: str
-    ) -> Optional[Dict[str, Any]]:
-        """Scrape a single documentation page."""
+    ) -> tuple[Optional[Dict[str, Any]], List[str]]:
+        """Scrape a single documentation page.
+
+        Returns the page's document (None if it has no usable content) along
+        with the documentation links found on it, from a single fetch and parse.
+        """
         try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return None
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
-
-                # Extract title
-                title_elem = soup.find("h1") or soup.find("title")
-                title = title_elem.get_text().strip() if title_elem else "Untitled"
-
-                # Extract main content
-                content_elem = (
-                    soup.find("main")
-                    or soup.find("article")
-                    or soup.find("div", class_="content")
-                    or soup.find("div", class_="documentation")
-                )
+            html = await self._fetch_page(session, url)
+            if html is None:
+                return None, []
 
-                if not content_elem:
-                    content_elem = soup.find("body")
+            # Parsing is CPU-bound; keep it off the event loop so the other
+            # workers' requests make progress in the meantime
+            return await asyncio.to_thread(self._parse_page, html, url)
 
-                if not content_elem:
-                    return None
+        except Exception as e:
+            logger.error("Error scraping page %s: %s", url, e)
+            return None, []
 
-                # Clean up content
-                content = self._extract_text_content(content_elem)
+    def _parse_page(
+        self, html: str, url: str
+    ) -> tuple[Optional[Dict[str, Any]], List[str]]:
+        """Extract the document and the documentation links from a page's HTML."""
+        # lxml's C parser is several times faster than html.parser
+        soup = BeautifulSoup(html, "lxml")
 
-                if not content.strip():
-                    return None
+        # Collect links before the content cleanup below drops the
+        # navigation elements
+        links = self._extract_doc_links(soup, url)
 
-                # Extract section information from URL or breadcrumbs
-                section, subsection = self._extract_section_info(soup, url)
+        # Extract title
+        title_elem = soup.find("h1") or soup.find("title")
+        title = title_elem.get_text().strip() if title_elem else "Untitled"
 
-                return {
-                    "url": url,
-                    "title": title,
-                    "content": content,
-                    "section": section,
-                    "subsection": subsection,
-                }
+        # Extract main content, in a single pass over the tree
+        content_elem = soup.select_one(_CONTENT_SELECTOR) or soup.body
 
-        except Exception as e:
-            logger.error(f"Error scraping page {url}: {e}")
-            return None
+        if not content_elem:
+            return None, links
+
+        # Clean up content
+        content = self._extract_text_content(content_elem)
+
+        if not content.strip():
+            return None, links
+
+        # Extract section information from URL or breadcrumbs
+        section, subsection = self._extract_section_info(soup, url)
+
+        return {
+            "url": url,
+            "title": title,
+            "content": content,
+            "section": section,
+            "subsection": subsection,
+        }, links
+
+    async def _fetch_page(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[str]:
+        """HTML of a page, or None if it isn't an HTML page that could be fetched.
+
+        With a page cache, a page that is already cached is requested
+        conditionally and its cached copy is reused when the server answers
+        304 Not Modified.
+        """
+        cached = self._page_cache.get(url) if self._page_cache else None
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        await self._rate_limiter.wait()
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and cached is not None:
+                logger.debug("Not modified: %s", url)
+                return cached.html
+
+            if response.status != 200:
+                logger.debug("Skipping %s: HTTP %d", url, response.status)
+                return None
+
+            # Sitemaps, images or downloads that got past the link filter
+            if "html" not in response.content_type:
+                return None
+
+            html = await self._read_page(response)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if self._page_cache is not None and (etag or last_modified):
+            self._page_cache.put(url, etag, last_modified, html)
+        return html
+
+    async def _read_page(self, response: aiohttp.ClientResponse) -> str:
+        """Read and decode a page body, up to MAX_PAGE_BYTES."""
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= MAX_PAGE_BYTES:
+                logger.warning(
+                    "Truncating %s to %d bytes", response.url, MAX_PAGE_BYTES
+                )
+                break
+
+        body = b"".join(chunks)[:MAX_PAGE_BYTES]
+        return body.decode(response.charset or "utf-8", errors="replace")
 
     def _extract_text_content(self, element) -> str:
         """Extract clean text content from HTML element."""
@@ -143,22 +385,13 @@ class DocumentationSearcher:
         for script in element(["script", "style", "nav", "footer", "header"]):
             script.decompose()
 
-        # Get text and clean it up
-        text = element.get_text()
-
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = " ".join(chunk for chunk in chunks if chunk)
-
-        return text
+        # Get text and collapse whitespace runs (line breaks included)
+        return _WS_RE.sub(" ", element.get_text()).strip()
 
     def _extract_section_info(self, soup: BeautifulSoup, url: str) -> tuple[str, str]:
         """Extract section and subsection information."""
         # Try to get from breadcrumbs
-        breadcrumb = soup.find("nav", class_="breadcrumb") or soup.find(
-            "ol", class_="breadcrumb"
-        )
+        breadcrumb = soup.select_one("nav.breadcrumb, ol.breadcrumb")
         if breadcrumb:
             links = breadcrumb.find_all("a")
             if len(links) >= 2:
@@ -169,49 +402,182 @@ class DocumentationSearcher:
         # Fallback to URL parsing
         path_parts = urlparse(url).path.strip("/").split("/")
         if len(path_parts) >= 2:
-            section = path_parts[1].replace("-", " ").title()
-            subsection = (
-                path_parts[2].replace("-", " ").title() if len(path_parts) > 2 else ""
-            )
+            section = _section_title(path_parts[1])
+            subsection = _section_title(path_parts[2]) if len(path_parts) > 2 else ""
             return section, subsection
 
         return "General", ""
 
-    async def _extract_doc_links(
-        self, session: aiohttp.ClientSession, url: str
-    ) -> List[str]:
-        """Extract documentation links from a page."""
-        try:
-            async with session.get(url) as response:
-                if response.status != 200:
-                    return []
-
-                html = await response.text()
-                soup = BeautifulSoup(html, "html.parser")
+    def _extract_doc_links(self, soup: BeautifulSoup, url: str) -> List[str]:
+        """Extract documentation links from a parsed page."""
+        base_url = self.base_url
+        skip = _SKIP_LINK_RE.search
+        # Keyed by URL to drop the many repeated navigation links while
+        # keeping their order
+        links = {}
+        for link in soup.find_all("a", href=True):
+            full_url = _normalize_url(urljoin(url, link["href"]))
+
+            # Only include documentation links
+            if full_url.startswith(base_url) and not skip(full_url):
+                links[full_url] = None
+
+        return list(links)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """The shared scraping session, created on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=SCRAPE_CONCURRENCY,
+                limit_per_host=SCRAPE_CONCURRENCY,
+                ttl_dns_cache=300,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self):
+        """Close the scraping session and, if it created it, the vector store."""
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._page_cache is not None:
+            self._page_cache.close()
+            self._page_cache = None
+        if self._owns_s3_store:
+            await self.s3_store.close()
 
-                links = []
-                for link in soup.find_all("a", href=True):
-                    href = link["href"]
-                    full_url = urljoin(url, href)
+    async def search(
+        self, query: str, limit: int = 5, section_filter: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Perform semantic search over the documentation.
+
+        Results are cached for ``cache_ttl`` seconds by normalized query, and
+        concurrent identical searches share a single lookup.
+        """
+        key = (query.strip().lower(), limit, section_filter)
+
+        while True:
+            async with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is not None:
+                    expires_at, results = entry
+                    if expires_at > time.monotonic():
+                        self._cache.move_to_end(key)
+                        return results
+                    del self._cache[key]
+
+                # The lookup runs as its own task rather than in the first
+                # caller, so that caller going away doesn't cancel it for
+                # everyone else (or leave the cache unfilled)
+                task = self._inflight.get(key)
+                if task is None:
+                    task = asyncio.create_task(
+                        self._search_and_cache(
+                            key, query, limit, section_filter, self._cache_generation
+                        )
+                    )
+                    # Mark a failure retrieved in case nobody is left waiting
+                    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+                    self._inflight[key] = task
+
+            try:
+                return await asyncio.shield(task)
+            except asyncio.CancelledError:
+                # If it was the shared lookup that got cancelled (by aclose())
+                # rather than us, start a new one
+                if task.cancelled() and not asyncio.current_task().cancelling():
+                    continue
+                raise
+
+    async def _search_and_cache(
+        self,
+        key: tuple,
+        query: str,
+        limit: int,
+        section_filter: Optional[str],
+        generation: int,
+    ) -> List[Dict[str, Any]]:
+        """Run one shared lookup and cache its results."""
+        try:
+            results = await self._search_uncached(key, query, limit, section_filter)
+        except BaseException:
+            self._inflight.pop(key, None)
+            raise
+
+        async with self._cache_lock:
+            self._inflight.pop(key, None)
+            if generation == self._cache_generation:
+                self._cache[key] = (time.monotonic() + self._cache_ttl, results)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self._cache_maxsize:
+                    self._cache.popitem(last=False)
+
+        return results
+
+    async def _search_uncached(
+        self, key: tuple, query: str, limit: int, section_filter: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Search the vector store, going through the semantic cache if enabled."""
+        if self._semantic_cache is None:
+            return await self.s3_store.search(query, limit, section_filter)
 
-                    # Only include documentation links
-                    if full_url.startswith(self.base_url) and not any(
-                        skip in full_url
-                        for skip in ["#", "mailto:", "tel:", ".pdf", ".zip"]
-                    ):
-                        links.append(full_url)
+        # Memoized by the store, so the search below doesn't encode it again
+        query_vector = np.asarray(
+            await self.s3_store.embed_query(query), dtype=np.float32
+        )
+        query_vector /= np.linalg.norm(query_vector) or 1.0
+
+        results = self._semantic_lookup(query_vector, limit, section_filter)
+        if results is not None:
+            logger.debug("Semantic cache hit for query: %s", query)
+            return results
+
+        generation = self._cache_generation
+        results = await self.s3_store.search(query, limit, section_filter)
+        if generation == self._cache_generation:
+            self._semantic_cache[key] = (
+                time.monotonic() + self._cache_ttl,
+                query_vector,
+                results,
+            )
+            self._semantic_cache.move_to_end(key)
+            while len(self._semantic_cache) > SEMANTIC_CACHE_SIZE:
+                self._semantic_cache.popitem(last=False)
+        return results
+
+    def _semantic_lookup(
+        self, query_vector: np.ndarray, limit: int, section_filter: Optional[str]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Results of the most similar cached search with the same options."""
+        now = time.monotonic()
+        keys, vectors = [], []
+        for key, (expires_at, vector, _) in list(self._semantic_cache.items()):
+            if expires_at <= now:
+                del self._semantic_cache[key]
+            elif key[1] == limit and key[2] == section_filter:
+                keys.append(key)
+                vectors.append(vector)
+
+        if not vectors:
+            return None
 
-                return links
+        similarities = np.stack(vectors) @ query_vector
+        best = int(np.argmax(similarities))
+        if similarities[best] < self._semantic_cache_threshold:
+            return None
 
-        except Exception as e:
-            logger.error(f"Error extracting links from {url}: {e}")
-            return []
+        self._semantic_cache.move_to_end(keys[best])
+        return self._semantic_cache[keys[best]][2]
 
-    async def search(
-        self, query: str, limit: int = 5, section_filter: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Perform semantic search over the documentation."""
-        return await self.s3_store.search(query, limit, section_filter)
+    def clear_cache(self):
+        """Forget cached search results, e.g. after the documentation changed."""
+        self._cache_generation += 1
+        self._cache.clear()
+        if self._semantic_cache is not None:
+            self._semantic_cache.clear()
 
     async def get_document_count(self) -> int:
         """Get the total number of documents in the S3 store."""
@@ -0,0 +1,46 @@
+"""
+On-disk cache of scraped documentation pages.
+Lets a re-scrape revalidate pages with conditional requests instead of
+downloading every page again.
+"""
+
+import sqlite3
+from typing import NamedTuple, Optional
+
+
+class CachedPage(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    html: str
+
+
+class PageCache:
+    """SQLite-backed store of page bodies and their HTTP validators, keyed by URL."""
+
+    def __init__(self, path: str):
+        self._db = sqlite3.connect(path)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, html TEXT NOT NULL)"
+            )
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """The cached copy of a page, if there is one."""
+        row = self._db.execute(
+            "SELECT etag, last_modified, html FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+        return CachedPage(*row) if row else None
+
+    def put(
+        self, url: str, etag: Optional[str], last_modified: Optional[str], html: str
+    ):
+        """Store a page along with the validators it was served with."""
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, html),
+            )
+
+    def close(self):
+        self._db.close()
@@ -4,15 +4,101 @@ Uses AWS S3 Vector Buckets native vector storage with local embeddings.
 """
 
 import asyncio
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 import concurrent.futures
 
+import aioboto3
 import boto3
+from botocore.exceptions import ClientError
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
+# PutVectors accepts up to 500 vectors per request
+MAX_PUT_VECTORS_BATCH = 500
+
+# Number of PutVectors requests bulk_add_documents keeps in flight at once
+PUT_VECTORS_CONCURRENCY = 4
+
+# Dynamically int8-quantized ONNX export of the model, published alongside the
+# PyTorch weights; ONNX Runtime runs it with AVX512-VNNI int8 kernels
+_ONNX_MODEL_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+# Number of distinct query strings whose embeddings are kept in memory
+QUERY_EMBEDDING_CACHE_SIZE = 256
+
+# How long the in-memory local index is served before it is reloaded. Uploads
+# normally come from a separate process, so this bounds how stale it can get.
+LOCAL_INDEX_TTL_SECONDS = 600.0
+# An empty load usually means the index hasn't been populated yet; retry soon
+LOCAL_INDEX_EMPTY_RETRY_SECONDS = 30.0
+
+# Error codes PutVectors returns when a request is over its size limits
+_BATCH_TOO_LARGE_ERRORS = {
+    "TooLargeBatch",
+    "RequestEntityTooLarge",
+}
+# ValidationException covers both oversized requests and bad vectors; only the
+# former, recognised by its message, is worth splitting the batch for
+_SIZE_LIMIT_MESSAGES = (
+    "request size",
+    "payload size",
+    "batch size",
+    "too many vectors",
+)
+
+
+def _is_batch_too_large(e: ClientError) -> bool:
+    """Whether PutVectors rejected a request for its size alone."""
+    error = e.response.get("Error", {})
+    code = error.get("Code")
+    if code in _BATCH_TOO_LARGE_ERRORS:
+        return True
+    if e.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 413:
+        return True
+    if code == "ValidationException":
+        message = error.get("Message", "").lower()
+        return any(phrase in message for phrase in _SIZE_LIMIT_MESSAGES)
+    return False
+
+
+def _to_float32_list(embedding: np.ndarray) -> List[float]:
+    """
+    Convert an embedding into floats that serialize at float32 precision.
+
+    S3 Vectors only stores float32, but ``tolist()`` widens each value to a
+    Python float whose JSON form carries ~17 significant digits. Going through
+    the shortest float32 repr roughly halves the request payload while the
+    service still decodes the exact same float32 values.
+    """
+    return [float(str(value)) for value in embedding.astype(np.float32)]
+
+
+def _doc_key(url: str) -> str:
+    """Stable vector key for a document URL, so re-ingesting a page upserts it."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+
+
+def _format_result(
+    rank: int, metadata: Dict[str, Any], similarity: float
+) -> Dict[str, Any]:
+    """Shape a search hit the way the documentation search tool returns it."""
+    return {
+        "id": rank,
+        "url": metadata.get("url", ""),
+        "title": metadata.get("title", ""),
+        "content": metadata.get("content_preview", ""),
+        "section": metadata.get("section", ""),
+        "subsection": metadata.get("subsection", ""),
+        "similarity": float(similarity),
+    }
+
 
 class S3VectorBucketStore:
     """S3 Vector Buckets-based vector store for documentation embeddings."""
@@ -23,6 +109,9 @@ class S3VectorBucketStore:
         region: str = "us-east-1",
         index_name: str = "docs-index",
         embedding_model: str = "all-MiniLM-L6-v2",
+        embedding_backend: str = "torch",
+        local_index: bool = False,
+        truncate_dim: Optional[int] = None,
     ):
         """
         Initialize S3 Vector Bucket store (synchronously).
@@ -32,6 +121,15 @@ class S3VectorBucketStore:
             region: AWS region (must support S3 Vectors preview)
             index_name: Name of the vector index within the bucket
             embedding_model: Local embedding model name
+            embedding_backend: "torch" to run the PyTorch model, or "onnx" to run
+                its int8 quantized ONNX export through ONNX Runtime
+            local_index: Serve searches from an in-memory copy of the index,
+                loaded from S3 Vectors on first search and reloaded every
+                LOCAL_INDEX_TTL_SECONDS, instead of calling QueryVectors for
+                every query
+            truncate_dim: Truncate embeddings to this many dimensions. Only
+                meaningful for Matryoshka-trained models; the index must have
+                been created with the same dimension
         """
         logger.info("Initializing S3 Vector Bucket store...")
 
@@ -39,38 +137,141 @@ class S3VectorBucketStore:
         self.region = region
         self.index_name = index_name
         self.embedding_model = embedding_model
+        self.embedding_backend = embedding_backend
+        self.local_index = local_index
+        self.truncate_dim = truncate_dim
 
         # These will be set below
         self.s3vectors_client: Optional[object] = None
+        # Async client for request-path calls, entered lazily on first use
+        # since __init__ runs outside the event loop
+        self._session = aioboto3.Session()
+        self._async_client_cm = None
+        self._async_client = None
+        self._async_client_lock = asyncio.Lock()
         self.local_model: Optional[SentenceTransformer] = None
         self.vector_dimensions: Optional[int] = None
-
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=4)
-        # Initialize S3 Vectors client
+        # (normalized embedding matrix, metadata per row, section per row),
+        # loaded lazily when local_index is enabled, dropped on writes and
+        # reloaded once it expires
+        self._local_index: Optional[tuple] = None
+        self._local_index_expires_at = 0.0
+        self._local_index_lock = asyncio.Lock()
+        # Query text -> embedding, least recently used first. The
+        # model is fixed for the store's lifetime so entries never go stale.
+        self._query_embeddings: OrderedDict[str, List[float]] = OrderedDict()
+
+        # Only used for model encodes; S3 Vectors calls go through aioboto3.
+        # Encodes are capped by the semaphore below, so more threads than
+        # that would only sit idle.
+        encode_workers = 2
+        self.executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=encode_workers, thread_name_prefix="s3vec"
+        )
+        # Each encode call already fans out over torch's intra-op threads, so
+        # concurrent encodes on CPU only thrash; serialize them unless on GPU.
+        self._encode_sem = asyncio.Semaphore(
+            encode_workers if torch.cuda.is_available() else 1
+        )
+        # Synchronous S3 Vectors client, only used to set up the bucket and
+        # index during construction
         self.s3vectors_client = boto3.client("s3vectors", region_name=self.region)
 
-        self.local_model = SentenceTransformer(self.embedding_model)
-        test_embedding = self.local_model.encode("test")
-        self.vector_dimensions = len(test_embedding)
+        if self.embedding_backend == "onnx":
+            self.local_model = SentenceTransformer(
+                self.embedding_model,
+                backend="onnx",
+                model_kwargs={"file_name": _ONNX_MODEL_FILE},
+                truncate_dim=self.truncate_dim,
+            )
+        else:
+            self.local_model = SentenceTransformer(
+                self.embedding_model, truncate_dim=self.truncate_dim
+            )
+            if self.local_model.device.type == "cuda":
+                # fp16 halves weight and activation memory traffic on GPU;
+                # embeddings are still uploaded as float32
+                self.local_model.half()
+        # Inference only: make sure dropout and friends are off
+        self.local_model.eval()
+        # Read the dimension from the model config rather than running a
+        # throwaway forward pass at startup
+        self.vector_dimensions = self.local_model.get_sentence_embedding_dimension()
         logger.info(
-            "Using local model '%s' with %d dimensions",
+            "Using local model '%s' (%s backend) with %d dimensions",
             self.embedding_model,
+            self.embedding_backend,
             self.vector_dimensions,
         )
 
         self._ensure_bucket_and_index()
         logger.info("S3 Vector Bucket store initialized")
 
+    async def _client(self):
+        """Return the shared async S3 Vectors client, creating it on first use."""
+        if self._async_client is None:
+            async with self._async_client_lock:
+                if self._async_client is None:
+                    self._async_client_cm = self._session.client(
+                        "s3vectors", region_name=self.region
+                    )
+                    self._async_client = await self._async_client_cm.__aenter__()
+        return self._async_client
+
     async def _get_embedding(self, text: str) -> List[float]:
         """Get embedding using local model."""
 
         def encode_text():
-            embedding = self.local_model.encode(text)
-            return embedding.tolist()
+            # Skip autograd/version-counter bookkeeping for the forward pass
+            with torch.inference_mode():
+                embedding = self.local_model.encode(text)
+            return _to_float32_list(embedding)
+
+        async with self._encode_sem:
+            return await asyncio.get_event_loop().run_in_executor(
+                self.executor, encode_text
+            )
 
-        return await asyncio.get_event_loop().run_in_executor(
-            self.executor, encode_text
-        )
+    async def embed_query(self, query: str) -> List[float]:
+        """Embedding for a search query, reused across repeated queries."""
+        embedding = self._query_embeddings.get(query)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(query)
+            return embedding
+
+        embedding = await self._get_embedding(query)
+        self._query_embeddings[query] = embedding
+        if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding
+
+    async def _get_embeddings(
+        self, texts: List[str], batch_size: int = 64
+    ) -> List[List[float]]:
+        """Get embeddings for many texts with a single batched encode call."""
+
+        def encode_texts():
+            with torch.inference_mode():
+                embeddings = self.local_model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                )
+            return [_to_float32_list(embedding) for embedding in embeddings]
+
+        async with self._encode_sem:
+            return await asyncio.get_event_loop().run_in_executor(
+                self.executor, encode_texts
+            )
+
+    async def warmup(self):
+        """
+        Run one throwaway encode so lazy backend setup (CUDA context, kernel
+        selection, ONNX Runtime graph optimization) happens now rather than on
+        the first real batch.
+        """
+        await self._get_embeddings(["warmup"])
 
     def _ensure_bucket_and_index(self):
         try:
@@ -89,7 +290,7 @@ class S3VectorBucketStore:
 
             # Check if index exists
             try:
-                self.s3vectors_client.get_index(
+                index_response = self.s3vectors_client.get_index(
                     vectorBucketName=self.bucket_name, indexName=self.index_name
                 )
                 logger.info(f"Vector index '{self.index_name}' already exists")
@@ -104,6 +305,14 @@ class S3VectorBucketStore:
                     distanceMetric="cosine",  # Use cosine similarity like the original implementation
                 )
                 logger.info(f"Created vector index '{self.index_name}'")
+            else:
+                dimension = index_response.get("index", {}).get("dimension")
+                if dimension is not None and dimension != self.vector_dimensions:
+                    raise ValueError(
+                        f"Vector index '{self.index_name}' has dimension {dimension} "
+                        f"but the embedding model produces {self.vector_dimensions}; "
+                        "use a different index_name or matching truncate_dim"
+                    )
 
         except Exception as e:
             logger.error(f"Error ensuring bucket and index: {e}")
@@ -114,8 +323,8 @@ class S3VectorBucketStore:
         # Generate embedding for the document content
         embedding = await self._get_embedding(doc_data["content"])
 
-        # Create unique key for the document (use URL hash or generate UUID)
-        doc_key = str(hash(doc_data["url"]))
+        # Create unique key for the document from its URL
+        doc_key = _doc_key(doc_data["url"])
 
         # Prepare metadata (S3 Vectors supports metadata for filtering)
         metadata = {
@@ -133,76 +342,131 @@ class S3VectorBucketStore:
             "metadata": metadata,
         }
 
-        def put_vectors_sync():
-            return self.s3vectors_client.put_vectors(
-                vectorBucketName=self.bucket_name,
-                indexName=self.index_name,
-                vectors=[vector_data],
-            )
-
-        await asyncio.get_event_loop().run_in_executor(self.executor, put_vectors_sync)
+        client = await self._client()
+        await client.put_vectors(
+            vectorBucketName=self.bucket_name,
+            indexName=self.index_name,
+            vectors=[vector_data],
+        )
+        self._local_index = None
 
         logger.debug(f"Added document to vector index: {doc_data['title']}")
 
     async def bulk_add_documents(
-        self, documents: List[Dict[str, Any]], batch_size: int = 100
+        self,
+        documents: List[Dict[str, Any]],
+        batch_size: int = MAX_PUT_VECTORS_BATCH,
+        concurrency: int = PUT_VECTORS_CONCURRENCY,
     ):
-        """Add multiple documents in batches for efficiency."""
+        """
+        Add multiple documents in batches for efficiency.
+
+        A document that already carries an ``embedding`` (e.g. computed by a
+        larger offline encode) is uploaded as is; only the rest are encoded.
+        """
         logger.info(f"Adding {len(documents)} documents to S3 Vector Bucket store...")
 
-        # Process documents in batches
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            vectors_batch = []
-
-            for doc_data in batch:
-                # Generate embedding
-                embedding = await self._get_embedding(doc_data["content"])
-
-                # Create unique key
-                doc_key = str(hash(doc_data["url"]))
-
-                # Prepare metadata
-                metadata = {
-                    "title": doc_data["title"],
-                    "url": doc_data["url"],
-                    "section": doc_data.get("section", ""),
-                    "subsection": doc_data.get("subsection", ""),
-                    "content_preview": doc_data["content"][:200],
-                }
-
-                vectors_batch.append(
-                    {
-                        "key": doc_key,
-                        "data": {"float32": embedding},
-                        "metadata": metadata,
+        total_batches = (len(documents) + batch_size - 1) // batch_size
+        uploaded_batches = 0
+        # Encoded batches waiting for upload; bounded so encoding stays at
+        # most a couple of batches ahead of the network
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def encode_batches():
+            # Encode batch N+1 (CPU bound) while batch N is being uploaded
+            for i in range(0, len(documents), batch_size):
+                batch = documents[i : i + batch_size]
+                vectors_batch = []
+
+                # Generate the missing embeddings for the whole batch in one
+                # encode call
+                texts = [doc["content"] for doc in batch if "embedding" not in doc]
+                encoded = iter(await self._get_embeddings(texts) if texts else ())
+                embeddings = [
+                    _to_float32_list(np.asarray(doc["embedding"]))
+                    if "embedding" in doc
+                    else next(encoded)
+                    for doc in batch
+                ]
+
+                for doc_data, embedding in zip(batch, embeddings):
+                    # Create unique key
+                    doc_key = _doc_key(doc_data["url"])
+
+                    # Prepare metadata
+                    metadata = {
+                        "title": doc_data["title"],
+                        "url": doc_data["url"],
+                        "section": doc_data.get("section", ""),
+                        "subsection": doc_data.get("subsection", ""),
+                        "content_preview": doc_data["content"][:200],
                     }
-                )
 
-            # Upload batch
-            def put_vectors_batch_sync():
-                return self.s3vectors_client.put_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=self.index_name,
-                    vectors=vectors_batch,
-                )
+                    vectors_batch.append(
+                        {
+                            "key": doc_key,
+                            "data": {"float32": embedding},
+                            "metadata": metadata,
+                        }
+                    )
 
-            await asyncio.get_event_loop().run_in_executor(
-                self.executor, put_vectors_batch_sync
-            )
+                await queue.put(vectors_batch)
 
-            logger.info(
-                f"Uploaded batch {i//batch_size + 1}/{(len(documents) + batch_size - 1)//batch_size}"
-            )
+            # One end marker per uploader
+            for _ in range(concurrency):
+                await queue.put(None)
+
+        async def upload_batches():
+            nonlocal uploaded_batches
+            while (vectors_batch := await queue.get()) is not None:
+                await self._put_vectors(vectors_batch)
+                uploaded_batches += 1
+                logger.info(f"Uploaded batch {uploaded_batches}/{total_batches}")
+
+        # Several uploaders drain the queue, so the PutVectors round trips of
+        # consecutive batches overlap. A failure in any task cancels the rest
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(encode_batches())
+            for _ in range(concurrency):
+                tg.create_task(upload_batches())
+
+        self._local_index = None
 
         logger.info("Bulk document addition completed")
 
+    async def _put_vectors(self, vectors: List[Dict[str, Any]]):
+        """
+        Upload vectors with a single PutVectors call, halving the batch and
+        retrying each half if the service rejects it as too large.
+        """
+        client = await self._client()
+        try:
+            await client.put_vectors(
+                vectorBucketName=self.bucket_name,
+                indexName=self.index_name,
+                vectors=vectors,
+            )
+        except ClientError as e:
+            code = e.response.get("Error", {}).get("Code")
+            if not _is_batch_too_large(e) or len(vectors) <= 1:
+                raise
+
+            middle = len(vectors) // 2
+            logger.warning(
+                f"PutVectors rejected batch of {len(vectors)} ({code}), splitting in half"
+            )
+            await self._put_vectors(vectors[:middle])
+            await self._put_vectors(vectors[middle:])
+
     async def search(
         self, query: str, limit: int = 5, section_filter: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Search for similar documents using S3 Vectors native search."""
         # Generate query embedding
-        query_embedding = await self._get_embedding(query)
+        query_embedding = await self.embed_query(query)
+
+        if self.local_index:
+            return await self._search_local(query_embedding, limit, section_filter)
 
         # Prepare metadata filter if section is specified
         metadata_filter = None
@@ -222,53 +486,139 @@ class S3VectorBucketStore:
         if metadata_filter:
             query_params["metadataFilter"] = metadata_filter
 
-        def query_vectors_sync():
-            return self.s3vectors_client.query_vectors(**query_params)
-
-        response = await asyncio.get_event_loop().run_in_executor(
-            self.executor, query_vectors_sync
-        )
+        client = await self._client()
+        response = await client.query_vectors(**query_params)
 
         # Format results to match original API
         results = []
         for i, vector_result in enumerate(response.get("vectors", [])):
-            metadata = vector_result.get("metadata", {})
-
             # Calculate similarity from distance (for cosine distance, similarity = 1 - distance)
             distance = vector_result.get("distance", 1.0)
             similarity = 1.0 - distance if distance is not None else 0.0
 
-            result = {
-                "id": i,
-                "url": metadata.get("url", ""),
-                "title": metadata.get("title", ""),
-                "content": metadata.get("content_preview", ""),
-                "section": metadata.get("section", ""),
-                "subsection": metadata.get("subsection", ""),
-                "similarity": float(similarity),
-            }
-            results.append(result)
+            results.append(
+                _format_result(i, vector_result.get("metadata", {}), similarity)
+            )
 
         return results
 
-    async def get_document_count(self) -> int:
-        """Get the total number of documents in the store."""
-        try:
+    async def _search_local(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        section_filter: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Exact cosine search over the in-memory copy of the index."""
+        matrix, metadata, sections = await self._get_local_index()
 
-            def list_vectors_sync():
-                return self.s3vectors_client.list_vectors(
-                    vectorBucketName=self.bucket_name,
-                    indexName=self.index_name,
-                    maxResults=1,  # We just want the total count
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_vector /= np.linalg.norm(query_vector) or 1.0
+
+        # Rows of the matrix are unit length, so the dot product is the cosine
+        # similarity S3 Vectors would report as 1 - distance
+        scores = matrix @ query_vector
+        candidates = np.arange(len(metadata))
+        if section_filter:
+            candidates = np.flatnonzero(sections == section_filter)
+            scores = scores[candidates]
+
+        k = min(limit, len(candidates))
+        if k <= 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [
+            _format_result(i, metadata[candidates[j]], scores[j])
+            for i, j in enumerate(top)
+        ]
+
+    async def _get_local_index(self) -> tuple:
+        """Return the in-memory index, pulling it from S3 Vectors if needed."""
+        index = self._local_index
+        if index is not None and (
+            time.monotonic() < self._local_index_expires_at
+            # Another search is already reloading it; keep serving this copy
+            or self._local_index_lock.locked()
+        ):
+            return index
+
+        async with self._local_index_lock:
+            if (
+                self._local_index is None
+                or time.monotonic() >= self._local_index_expires_at
+            ):
+                self._local_index = await self._load_local_index()
+                ttl = (
+                    LOCAL_INDEX_TTL_SECONDS
+                    if self._local_index[1]
+                    else LOCAL_INDEX_EMPTY_RETRY_SECONDS
                 )
+                self._local_index_expires_at = time.monotonic() + ttl
+            return self._local_index
 
-            response = await asyncio.get_event_loop().run_in_executor(
-                self.executor, list_vectors_sync
-            )
+    async def _load_local_index(self) -> tuple:
+        """Page through every vector in the index with ListVectors."""
+        client = await self._client()
+        params = {
+            "vectorBucketName": self.bucket_name,
+            "indexName": self.index_name,
+            "maxResults": 1000,
+            "returnData": True,
+            "returnMetadata": True,
+        }
 
-            # If S3 Vectors provides a total count in the response, use it
-            # Otherwise, we might need to paginate through all results
-            return response.get("totalVectorCount", 0)
+        embeddings = []
+        metadata = []
+        while True:
+            response = await client.list_vectors(**params)
+            for vector in response.get("vectors", []):
+                embeddings.append(vector["data"]["float32"])
+                metadata.append(vector.get("metadata", {}))
+
+            next_token = response.get("nextToken")
+            if not next_token:
+                break
+            params["nextToken"] = next_token
+
+        matrix = np.asarray(embeddings, dtype=np.float32).reshape(
+            len(embeddings), self.vector_dimensions
+        )
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+
+        sections = np.array([m.get("section", "") for m in metadata], dtype=object)
+
+        logger.info(f"Loaded {len(metadata)} vectors into the local search index")
+        return matrix, metadata, sections
+
+    async def get_document_count(self) -> int:
+        """Get the total number of documents in the store."""
+        try:
+            client = await self._client()
+            response = await client.get_index(
+                vectorBucketName=self.bucket_name, indexName=self.index_name
+            )
+            vector_count = response.get("index", {}).get("vectorCount")
+            if vector_count is not None:
+                return vector_count
+
+            # ListVectors has no total, so count keys page by page
+            params = {
+                "vectorBucketName": self.bucket_name,
+                "indexName": self.index_name,
+                "maxResults": 1000,
+            }
+            count = 0
+            while True:
+                response = await client.list_vectors(**params)
+                count += len(response.get("vectors", []))
+                next_token = response.get("nextToken")
+                if not next_token:
+                    return count
+                params["nextToken"] = next_token
 
         except Exception as e:
             logger.error(f"Error getting document count: {e}")
@@ -277,30 +627,21 @@ class S3VectorBucketStore:
     async def get_bucket_info(self) -> Dict[str, Any]:
         """Get information about the S3 vector bucket and index."""
         try:
+            client = await self._client()
 
-            def get_bucket_info_sync():
-                try:
-                    bucket_response = self.s3vectors_client.get_vector_bucket(
-                        vectorBucketName=self.bucket_name
-                    )
-                except:
-                    bucket_response = None
-
-                try:
-                    index_response = self.s3vectors_client.get_index(
-                        vectorBucketName=self.bucket_name, indexName=self.index_name
-                    )
-                except:
-                    index_response = None
-
-                return bucket_response, index_response
+            try:
+                bucket_response = await client.get_vector_bucket(
+                    vectorBucketName=self.bucket_name
+                )
+            except Exception:
+                bucket_response = None
 
-            (
-                bucket_response,
-                index_response,
-            ) = await asyncio.get_event_loop().run_in_executor(
-                self.executor, get_bucket_info_sync
-            )
+            try:
+                index_response = await client.get_index(
+                    vectorBucketName=self.bucket_name, indexName=self.index_name
+                )
+            except Exception:
+                index_response = None
 
             return {
                 "bucket_name": self.bucket_name,
@@ -313,6 +654,7 @@ class S3VectorBucketStore:
                 "index_info": index_response,
                 "embedding_method": "local",
                 "embedding_model": self.embedding_model,
+                "embedding_backend": self.embedding_backend,
             }
 
         except Exception as e:
@@ -326,6 +668,10 @@ class S3VectorBucketStore:
     async def close(self):
         """Close clients."""
         try:
+            if self._async_client_cm is not None:
+                await self._async_client_cm.__aexit__(None, None, None)
+                self._async_client_cm = None
+                self._async_client = None
             if self.s3vectors_client:
                 self.s3vectors_client.close()
             if self.executor:
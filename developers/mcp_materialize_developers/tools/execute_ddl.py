@@ -1,17 +1,55 @@
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 
-from psycopg import sql
-from psycopg.rows import dict_row
+from psycopg import AsyncConnection, AsyncPipeline, Error, sql
 from psycopg_pool import AsyncConnectionPool
 
 
+def _summary(
+    ddl: list[str],
+    cluster_name: Optional[str],
+    outcomes: list[Optional[BaseException]],
+) -> dict[str, Any]:
+    """
+    Build the tool result from one outcome per statement (None on success,
+    the exception otherwise). Statements past the end of outcomes never ran.
+    """
+    results = []
+    for i, stmt in enumerate(ddl):
+        result = {"statement_index": i, "sql": stmt, "status": "skipped"}
+        if i < len(outcomes):
+            outcome = outcomes[i]
+            if outcome is None:
+                result["status"] = "success"
+            else:
+                result["status"] = "error"
+                result["error"] = str(outcome)
+        results.append(result)
+
+    succeeded = sum(result["status"] == "success" for result in results)
+    return {
+        "status": "success" if succeeded == len(ddl) else "error",
+        "message": f"{succeeded} of {len(ddl)} statements executed successfully",
+        "cluster_name": cluster_name,
+        "results": results,
+    }
+
+
 class ExecuteDDL:
     __name__ = "execute_ddl"
 
     def __init__(self, pool: AsyncConnectionPool):
         self._pool = pool
+        # cluster name -> composed SET statement, quoted once per cluster
+        self._set_cluster_cache: dict[str, sql.Composed] = {}
 
-    async def __call__(self, ddl: list[str], cluster_name: Optional[str] = None):
+    async def __call__(
+        self,
+        ddl: list[str],
+        cluster_name: Optional[str] = None,
+        parallel: bool = False,
+        pipeline: bool = False,
+    ) -> dict[str, Any]:
         """
         Execute one or more DDL statements in Materialize.
         IMPORTANT: Always search documentation first before using this tool to verify correct Materialize SQL syntax and best practices.
@@ -19,13 +57,94 @@ class ExecuteDDL:
         Args:
             ddl: List of ddl statements to execute
             cluster_name: Name of the cluster to execute the ddl on
+            parallel: Execute the statements concurrently on separate connections.
+                Only use this when no statement depends on another one in the
+                list; the outcome of each statement is reported individually
+                (default: False, statements run in order and stop at the first error)
+            pipeline: Send the ordered statements to Materialize in a single round
+                trip instead of one per statement. The batch then runs as one
+                transaction: if any statement fails, or cannot run inside a
+                transaction, none of them is applied
+                (default: False, each statement is committed as it runs)
+
+        Returns:
+            Dictionary with the overall status and a per-statement result. In the
+            default mode a failing statement raises instead, after the statements
+            before it have been committed.
         """
+        if parallel:
+            return await self._execute_parallel(ddl, cluster_name)
+        if pipeline:
+            return await self._execute_pipeline(ddl, cluster_name)
+
+        async with self._pool.connection() as conn:
+            return await self._execute_sequential(conn, ddl, cluster_name)
+
+    def _set_cluster(self, cluster_name: str) -> sql.Composed:
+        stmt = self._set_cluster_cache.get(cluster_name)
+        if stmt is None:
+            stmt = sql.SQL("SET cluster = {}").format(sql.Identifier(cluster_name))
+            self._set_cluster_cache[cluster_name] = stmt
+        return stmt
+
+    async def _set_cluster_on(self, cur, cluster_name: Optional[str]):
+        if cluster_name:
+            await cur.execute(self._set_cluster(cluster_name), prepare=True)
+
+    async def _execute_sequential(
+        self, conn: AsyncConnection, ddl: list[str], cluster_name: Optional[str]
+    ) -> dict[str, Any]:
+        async with conn.cursor() as cur:
+            await self._set_cluster_on(cur, cluster_name)
+            for stmt in ddl:
+                await cur.execute(stmt)
+
+        return _summary(ddl, cluster_name, [None] * len(ddl))
+
+    async def _execute_pipeline(
+        self, ddl: list[str], cluster_name: Optional[str]
+    ) -> dict[str, Any]:
+        if not AsyncPipeline.is_supported():
+            # Replaying the batch one statement at a time would quietly give
+            # up atomicity, so run nothing and say why
+            result = _summary(ddl, cluster_name, [])
+            result["status"] = "error"
+            result["message"] = (
+                "Pipeline mode is not supported by the libpq in use; "
+                "no statements were executed"
+            )
+            return result
+
         async with self._pool.connection() as conn:
-            async with conn.cursor(row_factory=dict_row) as cur:
-                if cluster_name:
-                    await cur.execute(
-                        sql.SQL("SET cluster = {}").format(sql.Identifier(cluster_name))
-                    )
+            try:
+                async with conn.pipeline():
+                    async with conn.cursor() as cur:
+                        await self._set_cluster_on(cur, cluster_name)
+                        for stmt in ddl:
+                            await cur.execute(stmt)
+            except Error as e:
+                # The pipeline's implicit transaction was rolled back, so none
+                # of the statements took effect
+                result = _summary(ddl, cluster_name, [])
+                for statement in result["results"]:
+                    statement["status"] = "rolled_back"
+                result["status"] = "error"
+                result["message"] = f"Batch rolled back, no statements applied: {e}"
+                return result
+
+        return _summary(ddl, cluster_name, [None] * len(ddl))
 
-                for stmt in ddl:
+    async def _execute_parallel(
+        self, ddl: list[str], cluster_name: Optional[str]
+    ) -> dict[str, Any]:
+        async def execute_one(stmt: str):
+            async with self._pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    await self._set_cluster_on(cur, cluster_name)
                     await cur.execute(stmt)
+
+        # Statements beyond the pool size simply wait for a free connection
+        outcomes = await asyncio.gather(
+            *(execute_one(stmt) for stmt in ddl), return_exceptions=True
+        )
+        return _summary(ddl, cluster_name, outcomes)
@@ -1,12 +1,177 @@
-from psycopg.rows import dict_row
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Optional
+
 from psycopg_pool import AsyncConnectionPool
 
+# How long the catalog snapshot used to name objects is reused. The catalog
+# changes far less often than frontiers do.
+CATALOG_TTL_SECONDS = 30.0
+
+# Names, types, schemas and clusters of every object, keyed by id. Missing
+# schemas and clusters come back as NULL, as with the joins this replaces.
+_CATALOG_QUERY = """
+SELECT o.id, o.name, o.type, s.name, c.name
+FROM mz_objects o
+LEFT JOIN mz_schemas s ON o.schema_id = s.id
+LEFT JOIN mz_clusters c ON o.cluster_id = c.id
+"""
+
+# The lagging objects, their dependency chains and the critical path edges all
+# come back from one statement that walks the dependency graph once, tagged by
+# kind. Each branch pads the columns it doesn't use with NULLs. The text never
+# changes, so it is prepared once per connection. Frontiers come back as plain
+# milliseconds and objects as bare ids; the timestamp and lag arithmetic, the
+# names and the schema/cluster filters are all filled in from Python. Lagging
+# rows also carry the mz_now() they were picked against, so lags are measured
+# from the same instant as the threshold rather than the client's clock.
+_FRESHNESS_QUERY = """
+WITH MUTUALLY RECURSIVE
+input_of (source text, target text) AS (
+    SELECT dependency_id, object_id
+    FROM mz_internal.mz_compute_dependencies
+),
+-- Write frontiers as numbers, converted once for every use below
+frontiers (id text, write_frontier numeric) AS (
+    SELECT object_id, write_frontier::text::numeric
+    FROM mz_internal.mz_frontiers
+),
+-- User objects only; a range on the id rather than LIKE 'u%%', so it can be
+-- served by a range read and needs no per-row pattern match
+probes (id text) AS (
+    SELECT id
+    FROM frontiers
+    WHERE id >= 'u' AND id < 'v'
+      AND write_frontier > 0
+      AND write_frontier < mz_now()::text::numeric - %(threshold)s * 1000
+),
+-- Starts one hop out from each probe, so the (probe, probe, probe)
+-- seed rows that every branch filtered out never enter the fixpoint
+depends_on(probe text, prev text, next text) AS (
+    SELECT probes.id, input_of.source, input_of.target
+    FROM probes
+    JOIN input_of ON input_of.target = probes.id
+    UNION
+    SELECT depends_on.probe, input_of.source, input_of.target
+    FROM input_of, depends_on
+    WHERE depends_on.prev = input_of.target
+)
+SELECT
+    'lagging' as kind,
+    NULL::text as probe,
+    f.id as source_id,
+    NULL::text as target_id,
+    f.write_frontier,
+    NULL::numeric as path_lag_ms,
+    NULL::numeric as path_lag_seconds,
+    mz_now()::text::numeric as now_ms
+FROM probes
+JOIN frontiers f ON probes.id = f.id
+UNION ALL
+SELECT
+    'chain',
+    depends_on.probe,
+    depends_on.prev,
+    depends_on.next,
+    NULL, NULL, NULL, NULL
+FROM depends_on
+WHERE probe != next
+UNION ALL
+SELECT
+    'critical',
+    depends_on.probe,
+    depends_on.prev,
+    depends_on.next,
+    NULL,
+    fp.write_frontier - fn.write_frontier,
+    (fp.write_frontier - fn.write_frontier) / 1000.0,
+    NULL
+FROM depends_on
+JOIN frontiers fn ON depends_on.next = fn.id
+JOIN frontiers fp ON depends_on.prev = fp.id
+WHERE probe != prev
+  AND fp.write_frontier > fn.write_frontier
+-- Per kind: lagging objects by lag (oldest frontier first), chains by
+-- (probe, prev, next) and critical paths by lag; the other kinds' sort
+-- columns are all NULL
+ORDER BY kind, write_frontier, path_lag_ms DESC, probe, source_id, target_id
+"""
+
+# Catalog entry for ids missing from the snapshot
+_UNKNOWN = (None, None, None, None)
+
+
+# One slotted record per result row instead of a dict per row; they serialize
+# to the same JSON objects the dicts did.
+@dataclass(slots=True)
+class LaggingObject:
+    """An object whose write frontier is behind by more than the threshold."""
+
+    object_id: str
+    object_name: Optional[str]
+    schema_name: Optional[str]
+    object_type: Optional[str]
+    cluster_name: Optional[str]
+    write_frontier: int
+    write_frontier_time: datetime
+    lag_seconds: float
+    lag_ms: int
+    threshold_seconds: float
+
+
+@dataclass(slots=True)
+class DependencyEdge:
+    """An edge of the dependency chain upstream of a lagging object."""
+
+    probe_id: str
+    dependency_id: str
+    dependent_id: str
+    dependency_name: Optional[str]
+    dependent_name: Optional[str]
+    dependency_type: Optional[str]
+    dependent_type: Optional[str]
+
+
+@dataclass(slots=True)
+class CriticalPath:
+    """A dependency edge across which the write frontier falls behind."""
+
+    probe_id: str
+    source_id: str
+    target_id: str
+    source_name: Optional[str]
+    target_name: Optional[str]
+    source_type: Optional[str]
+    target_type: Optional[str]
+    lag_ms: Decimal
+    lag_seconds: Decimal
+
 
 class MonitorDataFreshness:
     __name__ = "monitor_data_freshness"
 
     def __init__(self, pool: AsyncConnectionPool):
         self._pool = pool
+        # {id: (name, type, schema_name, cluster_name)} and when it expires
+        self._catalog = {}
+        self._catalog_expires_at = 0.0
+        self._catalog_lock = asyncio.Lock()
+
+    async def _get_catalog(self, conn, refresh: bool = False) -> dict:
+        """Return the catalog snapshot, reloading it once it has expired."""
+        async with self._catalog_lock:
+            if refresh or time.monotonic() >= self._catalog_expires_at:
+                async with conn.cursor() as cur:
+                    await cur.execute(_CATALOG_QUERY)
+                    # One await for the whole catalog, then a plain comprehension
+                    self._catalog = {
+                        object_id: entry for object_id, *entry in await cur.fetchall()
+                    }
+                self._catalog_expires_at = time.monotonic() + CATALOG_TTL_SECONDS
+            return self._catalog
 
     async def __call__(
         self, threshold_seconds: float = 3.0, schema: str = None, cluster: str = None
@@ -29,163 +194,90 @@ class MonitorDataFreshness:
         pool = self._pool
         result = {"lagging_objects": [], "dependency_chains": [], "critical_paths": []}
 
-        async with pool.connection() as conn:
-            async with conn.cursor(row_factory=dict_row) as cur:
-                # 1. Get basic lagging objects info
-                lagging_query = """
-                SELECT 
-                    f.object_id,
-                    o.name as object_name,
-                    s.name as schema_name,
-                    o.type as object_type,
-                    c.name as cluster_name,
-                    f.write_frontier,
-                    to_timestamp(f.write_frontier::text::numeric / 1000) as write_frontier_time,
-                    EXTRACT(EPOCH FROM (mz_now()::timestamp - to_timestamp(f.write_frontier::text::numeric / 1000))) as lag_seconds
-                FROM mz_internal.mz_frontiers f
-                JOIN mz_objects o ON f.object_id = o.id
-                JOIN mz_schemas s ON o.schema_id = s.id
-                LEFT JOIN mz_clusters c ON o.cluster_id = c.id
-                WHERE f.write_frontier > 0
-                  AND mz_now() > to_timestamp(f.write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                  AND f.object_id LIKE 'u%%'
-                """
-
-                params = [threshold_seconds]
-                if schema:
-                    lagging_query += " AND s.name = %s"
-                    params.append(schema)
-                if cluster:
-                    lagging_query += " AND c.name = %s"
-                    params.append(cluster)
-
-                lagging_query += " ORDER BY lag_seconds DESC"
-
-                await cur.execute(lagging_query, params)
-                async for row in cur:
-                    lag_ms = row["lag_seconds"] * 1000 if row["lag_seconds"] else None
-                    result["lagging_objects"].append(
-                        {
-                            "object_id": row["object_id"],
-                            "object_name": row["object_name"],
-                            "schema_name": row["schema_name"],
-                            "object_type": row["object_type"],
-                            "cluster_name": row["cluster_name"],
-                            "write_frontier": row["write_frontier"],
-                            "write_frontier_time": row["write_frontier_time"],
-                            "lag_seconds": row["lag_seconds"],
-                            "lag_ms": lag_ms,
-                            "threshold_seconds": threshold_seconds,
-                        }
-                    )
+        lagging_objects = result["lagging_objects"]
+        dependency_chains = result["dependency_chains"]
+        critical_paths = result["critical_paths"]
 
-                # 2. Get full dependency chains for lagging objects
-                dependency_query = """
-                WITH MUTUALLY RECURSIVE
-                input_of (source text, target text) AS (
-                    SELECT dependency_id, object_id 
-                    FROM mz_internal.mz_compute_dependencies
-                ),
-                probes (id text) AS (
-                    SELECT object_id
-                    FROM mz_internal.mz_frontiers
-                    WHERE write_frontier > 0
-                      AND mz_now() > to_timestamp(write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                      AND object_id LIKE 'u%%'
-                ),
-                depends_on(probe text, prev text, next text) AS (
-                    SELECT id, id, id FROM probes
-                    UNION
-                    SELECT depends_on.probe, input_of.source, input_of.target
-                    FROM input_of, depends_on
-                    WHERE depends_on.prev = input_of.target
+        async with pool.connection() as conn:
+            catalog = await self._get_catalog(conn)
+            # Plain tuple rows, unpacked positionally; no per-row dict to
+            # copy out of before building the output entries
+            async with conn.cursor() as cur:
+                await cur.execute(
+                    _FRESHNESS_QUERY, {"threshold": threshold_seconds}, prepare=True
                 )
-                SELECT 
-                    depends_on.probe,
-                    depends_on.prev as dependency_id,
-                    depends_on.next as dependent_id,
-                    prev_obj.name as dependency_name,
-                    next_obj.name as dependent_name,
-                    prev_obj.type as dependency_type,
-                    next_obj.type as dependent_type
-                FROM depends_on
-                LEFT JOIN mz_objects prev_obj ON depends_on.prev = prev_obj.id
-                LEFT JOIN mz_objects next_obj ON depends_on.next = next_obj.id
-                WHERE probe != next
-                ORDER BY probe, prev, next
-                """
-
-                await cur.execute(dependency_query, [threshold_seconds])
-                async for row in cur:
-                    result["dependency_chains"].append(
-                        {
-                            "probe_id": row["probe"],
-                            "dependency_id": row["dependency_id"],
-                            "dependent_id": row["dependent_id"],
-                            "dependency_name": row["dependency_name"],
-                            "dependent_name": row["dependent_name"],
-                            "dependency_type": row["dependency_type"],
-                            "dependent_type": row["dependent_type"],
-                        }
+                rows = await cur.fetchall()
+
+            # A lagging object newer than the snapshot means it is out of date
+            if any(row[0] == "lagging" and row[2] not in catalog for row in rows):
+                catalog = await self._get_catalog(conn, refresh=True)
+
+        for (
+            kind,
+            probe,
+            source_id,
+            target_id,
+            write_frontier,
+            path_lag_ms,
+            path_lag_seconds,
+            now_ms,
+        ) in rows:
+            source_name, source_type, schema_name, cluster_name = catalog.get(
+                source_id, _UNKNOWN
+            )
+            if kind == "lagging":
+                # Objects dropped since the frontiers were read are skipped
+                if source_id not in catalog:
+                    continue
+                if schema and schema_name != schema:
+                    continue
+                if cluster and cluster_name != cluster:
+                    continue
+
+                write_frontier = int(write_frontier)
+                lag_ms = int(now_ms) - write_frontier
+                lagging_objects.append(
+                    LaggingObject(
+                        source_id,
+                        source_name,
+                        schema_name,
+                        source_type,
+                        cluster_name,
+                        write_frontier,
+                        datetime.fromtimestamp(write_frontier / 1000, tz=timezone.utc),
+                        lag_ms / 1000,
+                        lag_ms,
+                        threshold_seconds,
                     )
+                )
+                continue
 
-                # 3. Get critical path analysis with lag scoring
-                critical_path_query = """
-                WITH MUTUALLY RECURSIVE
-                input_of (source text, target text) AS (
-                    SELECT dependency_id, object_id 
-                    FROM mz_internal.mz_compute_dependencies
-                ),
-                probes (id text) AS (
-                    SELECT object_id
-                    FROM mz_internal.mz_frontiers
-                    WHERE write_frontier > 0
-                      AND mz_now() > to_timestamp(write_frontier::text::numeric / 1000) + INTERVAL '1 second' * %s
-                      AND object_id LIKE 'u%%'
-                ),
-                depends_on(probe text, prev text, next text) AS (
-                    SELECT id, id, id FROM probes
-                    UNION
-                    SELECT depends_on.probe, input_of.source, input_of.target
-                    FROM input_of, depends_on
-                    WHERE depends_on.prev = input_of.target
+            target_name, target_type, _, _ = catalog.get(target_id, _UNKNOWN)
+            if kind == "chain":
+                dependency_chains.append(
+                    DependencyEdge(
+                        probe,
+                        source_id,
+                        target_id,
+                        source_name,
+                        target_name,
+                        source_type,
+                        target_type,
+                    )
                 )
-                SELECT 
-                    depends_on.probe,
-                    depends_on.prev as source_id,
-                    depends_on.next as target_id,
-                    prev_obj.name as source_name,
-                    next_obj.name as target_name,
-                    prev_obj.type as source_type,
-                    next_obj.type as target_type,
-                    fp.write_frontier::text::numeric - fn.write_frontier::text::numeric as lag_ms,
-                    (fp.write_frontier::text::numeric - fn.write_frontier::text::numeric) / 1000.0 as lag_seconds
-                FROM depends_on, 
-                     mz_internal.mz_frontiers fn, 
-                     mz_internal.mz_frontiers fp
-                LEFT JOIN mz_objects prev_obj ON depends_on.prev = prev_obj.id
-                LEFT JOIN mz_objects next_obj ON depends_on.next = next_obj.id
-                WHERE probe != prev
-                  AND depends_on.next = fn.object_id
-                  AND depends_on.prev = fp.object_id  
-                  AND fp.write_frontier > fn.write_frontier
-                ORDER BY lag_ms DESC
-                """
-
-                await cur.execute(critical_path_query, [threshold_seconds])
-                async for row in cur:
-                    result["critical_paths"].append(
-                        {
-                            "probe_id": row["probe"],
-                            "source_id": row["source_id"],
-                            "target_id": row["target_id"],
-                            "source_name": row["source_name"],
-                            "target_name": row["target_name"],
-                            "source_type": row["source_type"],
-                            "target_type": row["target_type"],
-                            "lag_ms": row["lag_ms"],
-                            "lag_seconds": row["lag_seconds"],
-                        }
+            else:
+                critical_paths.append(
+                    CriticalPath(
+                        probe,
+                        source_id,
+                        target_id,
+                        source_name,
+                        target_name,
+                        source_type,
+                        target_type,
+                        path_lag_ms,
+                        path_lag_seconds,
                     )
+                )
 
         return result
@@ -1,6 +1,173 @@
+from datetime import datetime, timezone
+from typing import Optional
+
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 
+# How the target object is resolved: by (name, schema), or directly by id when
+# the caller already has one, which skips the name lookup entirely.
+_TARGET_BY_NAME = """
+    SELECT o.id
+    FROM mz_objects o
+    JOIN mz_schemas s ON o.schema_id = s.id
+    WHERE o.name = %s AND s.name = %s
+    LIMIT 1
+"""
+
+_TARGET_BY_ID = """
+    SELECT id FROM mz_objects WHERE id = %s
+"""
+
+# Resolves the target object and walks its dependencies upstream. The depth 0
+# row of depends_on is the target object itself.
+_DEPENDS_ON = """
+WITH MUTUALLY RECURSIVE
+input_of (source text, target text) AS (
+    SELECT dependency_id, object_id
+    FROM mz_internal.mz_compute_dependencies
+),
+target (id text) AS ({target}),
+depends_on(prev text, next text, depth int) AS (
+    SELECT id, id, 0 FROM target
+    UNION
+    SELECT input_of.source, depends_on.prev, depends_on.depth + 1
+    FROM input_of, depends_on
+    WHERE depends_on.prev = input_of.target
+    AND depends_on.depth < 10  -- Prevent infinite recursion
+)
+"""
+
+# Each object in the chain is returned once ('target' for the object being
+# diagnosed, 'object' for the rest), followed by the bare dependency edges
+# ('edge') that reference them by id. Joining the catalog and frontiers per
+# object instead of per edge endpoint halves the join work and payload.
+_CHAIN = """
+SELECT
+    CASE WHEN target.id IS NULL THEN 'object' ELSE 'target' END as kind,
+    ids.id as object_id,
+    NULL::text as dependent_id,
+    NULL::int as depth,
+    o.name as object_name,
+    o.type as object_type,
+    s.name as schema_name,
+    c.name as cluster_name,
+    f.write_frontier,
+    (mz_now()::text::numeric - f.write_frontier::text::numeric) / 1000.0 as lag_seconds
+FROM (SELECT DISTINCT prev as id FROM depends_on) ids
+LEFT JOIN target ON ids.id = target.id
+LEFT JOIN mz_objects o ON ids.id = o.id
+LEFT JOIN mz_schemas s ON o.schema_id = s.id
+LEFT JOIN mz_clusters c ON o.cluster_id = c.id
+LEFT JOIN mz_internal.mz_frontiers f ON ids.id = f.object_id
+UNION ALL
+SELECT DISTINCT
+    'edge',
+    depends_on.prev,
+    depends_on.next,
+    depends_on.depth,
+    NULL::text,
+    NULL::text,
+    NULL::text,
+    NULL::text,
+    NULL::mz_timestamp,
+    NULL::numeric
+FROM depends_on
+WHERE depends_on.depth > 0 AND depends_on.prev != depends_on.next
+ORDER BY kind DESC, depth, object_id, dependent_id
+"""
+
+# A single row with the target object (shaped like the 'target' row of
+# _CHAIN_QUERY) and the chain summary aggregated server-side.
+_SUMMARY = """
+SELECT
+    target.id as object_id,
+    o.name as object_name,
+    o.type as object_type,
+    s.name as schema_name,
+    c.name as cluster_name,
+    f.write_frontier,
+    (mz_now()::text::numeric - f.write_frontier::text::numeric) / 1000.0 as lag_seconds,
+    summary.total_dependencies,
+    summary.stale_dependencies,
+    summary.max_lag_seconds
+FROM target
+LEFT JOIN mz_objects o ON target.id = o.id
+LEFT JOIN mz_schemas s ON o.schema_id = s.id
+LEFT JOIN mz_clusters c ON o.cluster_id = c.id
+LEFT JOIN mz_internal.mz_frontiers f ON target.id = f.object_id,
+(
+    SELECT
+        COUNT(*) as total_dependencies,
+        COUNT(*) FILTER (WHERE dependency_lag_seconds > 0.1) as stale_dependencies,
+        COALESCE(MAX(GREATEST(dependency_lag_seconds, dependent_lag_seconds)), 0) as max_lag_seconds
+    FROM (
+        SELECT DISTINCT
+            depends_on.prev,
+            depends_on.next,
+            depends_on.depth,
+            COALESCE((mz_now()::text::numeric - dep_f.write_frontier::text::numeric) / 1000.0, 0) as dependency_lag_seconds,
+            COALESCE((mz_now()::text::numeric - dependent_f.write_frontier::text::numeric) / 1000.0, 0) as dependent_lag_seconds
+        FROM depends_on
+        LEFT JOIN mz_internal.mz_frontiers dep_f ON depends_on.prev = dep_f.object_id
+        LEFT JOIN mz_internal.mz_frontiers dependent_f ON depends_on.next = dependent_f.object_id
+        WHERE depends_on.depth > 0 AND depends_on.prev != depends_on.next
+    ) edges
+) summary
+"""
+
+# Both queries, keyed by whether the target is resolved by "name" or "id"
+_CHAIN_QUERY = {}
+_SUMMARY_QUERY = {}
+for _key, _target in (("name", _TARGET_BY_NAME), ("id", _TARGET_BY_ID)):
+    _CHAIN_QUERY[_key] = _DEPENDS_ON.format(target=_target) + _CHAIN
+    _SUMMARY_QUERY[_key] = _DEPENDS_ON.format(target=_target) + _SUMMARY
+
+
+def _frontier_time(write_frontier) -> Optional[datetime]:
+    """Convert a write frontier (milliseconds since the epoch) to a timestamp."""
+    if write_frontier is None:
+        return None
+    return datetime.fromtimestamp(int(write_frontier) / 1000, tz=timezone.utc)
+
+
+def _target_object(row: dict) -> dict:
+    """Build the target_object entry from the row describing the target."""
+    # Calculate lag in milliseconds
+    lag_seconds = row["lag_seconds"]
+    lag_ms = lag_seconds * 1000 if lag_seconds else 0
+
+    return {
+        "object_id": row["object_id"],
+        "object_name": row["object_name"],
+        "schema_name": row["schema_name"],
+        "object_type": row["object_type"],
+        "cluster_name": row["cluster_name"],
+        "write_frontier": row["write_frontier"],
+        "write_frontier_time": _frontier_time(row["write_frontier"]),
+        "lag_seconds": lag_seconds,
+        "lag_ms": lag_ms,
+        "is_stale": lag_ms > 100,  # Consider >100ms as stale
+    }
+
+
+def _chain_member(row: dict) -> dict:
+    """Build the dependency/dependent entry for an object in the chain."""
+    lag_seconds = row["lag_seconds"] or 0
+    lag_ms = lag_seconds * 1000
+
+    return {
+        "object_id": row["object_id"],
+        "name": row["object_name"],
+        "type": row["object_type"],
+        "schema": row["schema_name"],
+        "cluster": row["cluster_name"],
+        "write_frontier": row["write_frontier"],
+        "write_frontier_time": _frontier_time(row["write_frontier"]),
+        "lag_seconds": lag_seconds,
+        "lag_ms": lag_ms,
+        "is_stale": lag_ms > 100,
+    }
+
 
 class ObjectFreshnessDiagnostics:
     __name__ = "object_freshness_diagnostics"
@@ -8,7 +175,13 @@ class ObjectFreshnessDiagnostics:
     def __init__(self, pool: AsyncConnectionPool):
         self._pool = pool
 
-    async def __call__(self, object_name: str, schema: str = "public") -> dict:
+    async def __call__(
+        self,
+        object_name: Optional[str] = None,
+        schema: str = "public",
+        summary_only: bool = False,
+        object_id: Optional[str] = None,
+    ) -> dict:
         """
         Get detailed freshness diagnostics for a specific object, showing its freshness and
         the complete dependency chain with freshness information for each dependency.
@@ -16,6 +189,10 @@ class ObjectFreshnessDiagnostics:
         Args:
             object_name: Name of the object to analyze
             schema: Schema name (default: "public")
+            summary_only: Only return the target object and the freshness summary,
+                skipping the per-dependency chain (default: False)
+            object_id: ID of the object to analyze (e.g. "u123"). When given, the
+                object is looked up by id and object_name/schema are ignored
 
         Returns:
             Dictionary containing:
@@ -23,6 +200,15 @@ class ObjectFreshnessDiagnostics:
             - dependency_chain: All dependencies with their individual freshness
             - freshness_summary: Summary of freshness issues in the chain
         """
+        if object_id is not None:
+            lookup, params = "id", [object_id]
+            not_found = f"Object with id '{object_id}' not found"
+        elif object_name is not None:
+            lookup, params = "name", [object_name, schema]
+            not_found = f"Object '{object_name}' not found in schema '{schema}'"
+        else:
+            return {"error": "Either object_name or object_id must be provided"}
+
         pool = self._pool
         result = {
             "target_object": None,
@@ -36,161 +222,76 @@ class ObjectFreshnessDiagnostics:
         }
 
         async with pool.connection() as conn:
-            async with conn.cursor(row_factory=dict_row) as cur:
-                # 1. Get target object information and freshness
-                target_query = """
-                SELECT 
-                    f.object_id,
-                    o.name as object_name,
-                    s.name as schema_name,
-                    o.type as object_type,
-                    c.name as cluster_name,
-                    f.write_frontier,
-                    to_timestamp(f.write_frontier::text::numeric / 1000) as write_frontier_time,
-                    EXTRACT(EPOCH FROM (mz_now()::timestamp - to_timestamp(f.write_frontier::text::numeric / 1000))) as lag_seconds
-                FROM mz_objects o
-                JOIN mz_schemas s ON o.schema_id = s.id
-                LEFT JOIN mz_clusters c ON o.cluster_id = c.id
-                LEFT JOIN mz_internal.mz_frontiers f ON o.id = f.object_id
-                WHERE o.name = %s AND s.name = %s
-                LIMIT 1
-                """
-
-                await cur.execute(target_query, [object_name, schema])
-                target_row = await cur.fetchone()
-
-                if not target_row:
-                    return {
-                        "error": f"Object '{object_name}' not found in schema '{schema}'"
-                    }
+            if summary_only:
+                async with conn.cursor(row_factory=dict_row) as cur:
+                    await cur.execute(_SUMMARY_QUERY[lookup], params)
+                    row = await cur.fetchone()
 
-                # Calculate lag in milliseconds
-                lag_ms = (
-                    target_row["lag_seconds"] * 1000 if target_row["lag_seconds"] else 0
-                )
-
-                result["target_object"] = {
-                    "object_id": target_row["object_id"],
-                    "object_name": target_row["object_name"],
-                    "schema_name": target_row["schema_name"],
-                    "object_type": target_row["object_type"],
-                    "cluster_name": target_row["cluster_name"],
-                    "write_frontier": target_row["write_frontier"],
-                    "write_frontier_time": target_row["write_frontier_time"],
-                    "lag_seconds": target_row["lag_seconds"],
-                    "lag_ms": lag_ms,
-                    "is_stale": lag_ms > 100,  # Consider >100ms as stale
-                }
+                if not row:
+                    return {"error": not_found}
 
-                target_object_id = target_row["object_id"]
-
-                # 2. Get complete dependency chain with freshness for each dependency
-                dependency_query = """
-                WITH MUTUALLY RECURSIVE
-                input_of (source text, target text) AS (
-                    SELECT dependency_id, object_id 
-                    FROM mz_internal.mz_compute_dependencies
-                ),
-                depends_on(prev text, next text, depth int) AS (
-                    SELECT %s, %s, 0
-                    UNION
-                    SELECT input_of.source, depends_on.prev, depends_on.depth + 1
-                    FROM input_of, depends_on
-                    WHERE depends_on.prev = input_of.target
-                    AND depends_on.depth < 10  -- Prevent infinite recursion
-                )
-                SELECT DISTINCT
-                    depends_on.prev as dependency_id,
-                    depends_on.next as dependent_id,
-                    depends_on.depth,
-                    dep_obj.name as dependency_name,
-                    dep_obj.type as dependency_type,
-                    dep_schema.name as dependency_schema,
-                    dep_cluster.name as dependency_cluster,
-                    dependent_obj.name as dependent_name,
-                    dependent_obj.type as dependent_type,
-                    dependent_schema.name as dependent_schema,
-                    dependent_cluster.name as dependent_cluster,
-                    dep_f.write_frontier as dependency_frontier,
-                    to_timestamp(dep_f.write_frontier::text::numeric / 1000) as dependency_frontier_time,
-                    EXTRACT(EPOCH FROM (mz_now()::timestamp - to_timestamp(dep_f.write_frontier::text::numeric / 1000))) as dependency_lag_seconds,
-                    dependent_f.write_frontier as dependent_frontier,
-                    to_timestamp(dependent_f.write_frontier::text::numeric / 1000) as dependent_frontier_time,
-                    EXTRACT(EPOCH FROM (mz_now()::timestamp - to_timestamp(dependent_f.write_frontier::text::numeric / 1000))) as dependent_lag_seconds
-                FROM depends_on
-                LEFT JOIN mz_objects dep_obj ON depends_on.prev = dep_obj.id
-                LEFT JOIN mz_schemas dep_schema ON dep_obj.schema_id = dep_schema.id
-                LEFT JOIN mz_clusters dep_cluster ON dep_obj.cluster_id = dep_cluster.id
-                LEFT JOIN mz_internal.mz_frontiers dep_f ON depends_on.prev = dep_f.object_id
-                LEFT JOIN mz_objects dependent_obj ON depends_on.next = dependent_obj.id
-                LEFT JOIN mz_schemas dependent_schema ON dependent_obj.schema_id = dependent_schema.id
-                LEFT JOIN mz_clusters dependent_cluster ON dependent_obj.cluster_id = dependent_cluster.id
-                LEFT JOIN mz_internal.mz_frontiers dependent_f ON depends_on.next = dependent_f.object_id
-                WHERE depends_on.prev != depends_on.next
-                ORDER BY depends_on.depth, depends_on.prev, depends_on.next
-                """
-
-                await cur.execute(
-                    dependency_query, [target_object_id, target_object_id]
-                )
-
-                max_lag = 0
-                stale_count = 0
-                total_count = 0
-
-                async for row in cur:
-                    total_count += 1
-
-                    # Calculate lag for dependency
-                    dep_lag_seconds = row["dependency_lag_seconds"] or 0
-                    dep_lag_ms = dep_lag_seconds * 1000
-                    dependent_lag_seconds = row["dependent_lag_seconds"] or 0
-                    dependent_lag_ms = dependent_lag_seconds * 1000
-
-                    is_dep_stale = dep_lag_ms > 100
-                    is_dependent_stale = dependent_lag_ms > 100
-
-                    if is_dep_stale:
-                        stale_count += 1
-
-                    max_lag = max(max_lag, dep_lag_seconds, dependent_lag_seconds)
-
-                    result["dependency_chain"].append(
-                        {
-                            "depth": row["depth"],
-                            "dependency": {
-                                "object_id": row["dependency_id"],
-                                "name": row["dependency_name"],
-                                "type": row["dependency_type"],
-                                "schema": row["dependency_schema"],
-                                "cluster": row["dependency_cluster"],
-                                "write_frontier": row["dependency_frontier"],
-                                "write_frontier_time": row["dependency_frontier_time"],
-                                "lag_seconds": dep_lag_seconds,
-                                "lag_ms": dep_lag_ms,
-                                "is_stale": is_dep_stale,
-                            },
-                            "dependent": {
-                                "object_id": row["dependent_id"],
-                                "name": row["dependent_name"],
-                                "type": row["dependent_type"],
-                                "schema": row["dependent_schema"],
-                                "cluster": row["dependent_cluster"],
-                                "write_frontier": row["dependent_frontier"],
-                                "write_frontier_time": row["dependent_frontier_time"],
-                                "lag_seconds": dependent_lag_seconds,
-                                "lag_ms": dependent_lag_ms,
-                                "is_stale": is_dependent_stale,
-                            },
-                        }
-                    )
-
-                # Update summary
+                result["target_object"] = _target_object(row)
                 result["freshness_summary"] = {
-                    "total_dependencies": total_count,
-                    "stale_dependencies": stale_count,
-                    "max_lag_seconds": max_lag,
-                    "critical_path_lag_seconds": max_lag,  # For now, use max lag as critical path
+                    "total_dependencies": row["total_dependencies"],
+                    "stale_dependencies": row["stale_dependencies"],
+                    "max_lag_seconds": row["max_lag_seconds"],
+                    "critical_path_lag_seconds": row["max_lag_seconds"],
                 }
+                return result
+
+            # Named (server-side) cursors only exist inside a transaction block
+            async with conn.transaction():
+                async with conn.cursor(
+                    "object_freshness_diagnostics", row_factory=dict_row
+                ) as cur:
+                    # Stream the dependency chain in chunks rather than
+                    # buffering the whole DAG client-side; chunks are large
+                    # enough that each FETCH round trip covers many rows
+                    cur.itersize = 2000
+                    await cur.execute(_CHAIN_QUERY[lookup], params)
+
+                    max_lag = 0
+                    stale_count = 0
+                    total_count = 0
+                    # Objects arrive before the edges referencing them
+                    members = {}
+
+                    async for row in cur:
+                        if row["kind"] != "edge":
+                            members[row["object_id"]] = _chain_member(row)
+                            if row["kind"] == "target":
+                                result["target_object"] = _target_object(row)
+                            continue
+
+                        total_count += 1
+
+                        dependency = members[row["object_id"]]
+                        dependent = members[row["dependent_id"]]
+
+                        if dependency["is_stale"]:
+                            stale_count += 1
+
+                        max_lag = max(
+                            max_lag, dependency["lag_seconds"], dependent["lag_seconds"]
+                        )
+
+                        result["dependency_chain"].append(
+                            {
+                                "depth": row["depth"],
+                                "dependency": dependency,
+                                "dependent": dependent,
+                            }
+                        )
+
+                    if result["target_object"] is None:
+                        return {"error": not_found}
+
+                    # Update summary
+                    result["freshness_summary"] = {
+                        "total_dependencies": total_count,
+                        "stale_dependencies": stale_count,
+                        "max_lag_seconds": max_lag,
+                        "critical_path_lag_seconds": max_lag,  # For now, use max lag as critical path
+                    }
 
         return result
@@ -1,3 +1,4 @@
+import contextlib
 from typing import Any
 
 from psycopg import sql
@@ -19,7 +20,8 @@ class RunSqlTransaction:
 
         Args:
             cluster_name: Name of the cluster to execute the transaction on
-            sql_statements: List of SQL statements to execute
+            sql_statements: List of SQL statements to execute, one statement per entry (several
+                semicolon-separated statements in a single entry are not supported)
             isolation_level: Optional isolation level to set (e.g., 'strict serializable', 'serializable', etc.)
 
         Returns:
@@ -28,43 +30,62 @@ class RunSqlTransaction:
 
         pool = self._pool
         results = []
+        # Blank statements are dropped up front, keeping their original index
+        statements = [
+            (i, stmt)
+            for i, stmt in enumerate(sql_statements)
+            if stmt and not stmt.isspace()
+        ]
 
         async with pool.connection() as conn:
             try:
                 async with conn.cursor(row_factory=dict_row) as cur:
-                    await cur.execute(
+                    preamble = [
                         sql.SQL("SET cluster = {}").format(sql.Identifier(cluster_name))
-                    )
-
+                    ]
                     if isolation_level:
-                        await cur.execute(
+                        preamble.append(
                             sql.SQL("SET transaction_isolation = {}").format(
                                 sql.Literal(isolation_level)
                             )
                         )
+                    preamble.append(sql.SQL("BEGIN READ ONLY"))
+
+                    # Sent as one multi-statement string, in a single round
+                    # trip. The SETs are retroactively part of the read-only
+                    # transaction, so the rollback below also resets them.
+                    await cur.execute(sql.SQL("; ").join(preamble))
+
+                    # Send every statement before reading any result back, so
+                    # the batch costs one round trip rather than one per
+                    # statement. Each statement gets its own cursor to hold
+                    # its result until it is read; the stack closes them all.
+                    pending = []
+                    async with conn.pipeline(), contextlib.AsyncExitStack() as cursors:
+                        for i, sql_stmt in statements:
+                            stmt_cur = await cursors.enter_async_context(
+                                conn.cursor(row_factory=dict_row)
+                            )
+                            await stmt_cur.execute(sql_stmt)
+                            pending.append((i, sql_stmt, stmt_cur))
+
+                        for i, sql_stmt, stmt_cur in pending:
+                            rows = await stmt_cur.fetchall() or []
+                            columns = (
+                                [desc.name for desc in stmt_cur.description]
+                                if stmt_cur.description
+                                else []
+                            )
 
-                    await cur.execute("BEGIN READ ONLY")
-                    for i, sql_stmt in enumerate(sql_statements):
-                        if not sql_stmt.strip():
-                            continue
-
-                        await cur.execute(sql_stmt)
-                        rows = await cur.fetchall() or []
-                        columns = (
-                            [desc.name for desc in cur.description]
-                            if cur.description
-                            else []
-                        )
-
-                        results.append(
-                            {
-                                "statement_index": i,
-                                "sql": sql_stmt,
-                                "row_count": len(rows),
-                                "columns": columns,
-                                "rows": rows,
-                            }
-                        )
+                            results.append(
+                                {
+                                    "statement_index": i,
+                                    "sql": sql_stmt,
+                                    "row_count": len(rows),
+                                    "columns": columns,
+                                    "rows": rows,
+                                }
+                            )
 
                     await conn.rollback()
 
@@ -73,7 +94,7 @@ class RunSqlTransaction:
                         "message": f"Transaction executed successfully on cluster '{cluster_name}'",
                         "cluster_name": cluster_name,
                         "isolation_level": isolation_level,
-                        "statements_executed": len(sql_statements),
+                        "statements_executed": len(statements),
                         "results": results,
                     }
 
@@ -6,8 +6,23 @@ from ..search.doc_search import DocumentationSearcher
 class SearchDocumentation:
     __name__ = "search_documentation"
 
-    def __init__(self):
-        self.searcher = DocumentationSearcher()
+    def __init__(
+        self,
+        bucket_name: str = "materialize-docs-vectors",
+        cache_maxsize: int = 512,
+        cache_ttl: float = 300,
+        embedding_backend: str = "torch",
+        local_index: bool = False,
+        semantic_cache: bool = False,
+    ):
+        self.searcher = DocumentationSearcher(
+            bucket_name=bucket_name,
+            embedding_backend=embedding_backend,
+            local_index=local_index,
+            cache_maxsize=cache_maxsize,
+            cache_ttl=cache_ttl,
+            semantic_cache=semantic_cache,
+        )
 
     async def __call__(
         self, query: str, limit: int = 5, section_filter: Optional[str] = None
@@ -21,5 +36,4 @@ class SearchDocumentation:
             limit: The maximum number of documents to return (default 5)
             section_filter: Optional section filter to limit search to specific sections
         """
-
         return await self.searcher.search(query, limit, section_filter)
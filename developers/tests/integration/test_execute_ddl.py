@@ -0,0 +1,63 @@
+import pytest
+import pytest_asyncio
+from psycopg import Error
+from psycopg_pool import AsyncConnectionPool
+
+from mcp_materialize_developers.tools.execute_ddl import ExecuteDDL
+
+DDL = [
+    "CREATE VIEW ddl_first AS SELECT 1 AS id",
+    "CREATE VIEW ddl_broken AS SELECT * FROM ddl_missing",
+    "CREATE VIEW ddl_last AS SELECT 1 AS id",
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def ddl_pool(materialize_pool):
+    # Autocommit, as the server configures the connections it runs DDL on
+    async def configure(conn):
+        await conn.set_autocommit(True)
+
+    pool = AsyncConnectionPool(
+        conninfo=materialize_pool.conninfo,
+        min_size=1,
+        max_size=4,
+        configure=configure,
+        open=False,
+    )
+    await pool.open()
+    yield pool
+    await pool.close()
+
+
+async def view_names(pool: AsyncConnectionPool) -> set[str]:
+    async with pool.connection() as conn:
+        async with conn.cursor() as cur:
+            await cur.execute("SELECT name FROM mz_views WHERE name LIKE 'ddl_%'")
+            return {name for (name,) in await cur.fetchall()}
+
+
+@pytest.mark.asyncio
+async def test_sequential_stops_at_first_error(ddl_pool):
+    with pytest.raises(Error):
+        await ExecuteDDL(ddl_pool)(DDL)
+
+    # The statement before the failure stays committed; the one after never ran
+    assert await view_names(ddl_pool) == {"ddl_first"}
+
+
+@pytest.mark.asyncio
+async def test_sequential_success(ddl_pool):
+    result = await ExecuteDDL(ddl_pool)([DDL[0], DDL[2]])
+    assert result["status"] == "success"
+    assert await view_names(ddl_pool) == {"ddl_first", "ddl_last"}
+
+
+@pytest.mark.asyncio
+async def test_pipeline_rolls_back(ddl_pool):
+    result = await ExecuteDDL(ddl_pool)(DDL, pipeline=True)
+    assert result["status"] == "error"
+    assert result["message"].startswith("Batch rolled back")
+    assert [r["status"] for r in result["results"]] == ["rolled_back"] * 3
+
+    assert await view_names(ddl_pool) == set()
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from psycopg import AsyncPipeline, errors
+
+from mcp_materialize_developers.tools.execute_ddl import ExecuteDDL, _summary
+
+DDL = [
+    "CREATE VIEW a AS SELECT 1",
+    "CREATE VIEW b AS SELECT 2",
+    "CREATE VIEW c AS SELECT 3",
+]
+
+
+def test_summary_all_succeeded():
+    result = _summary(DDL, "quickstart", [None, None, None])
+    assert result == {
+        "status": "success",
+        "message": "3 of 3 statements executed successfully",
+        "cluster_name": "quickstart",
+        "results": [
+            {"statement_index": 0, "sql": DDL[0], "status": "success"},
+            {"statement_index": 1, "sql": DDL[1], "status": "success"},
+            {"statement_index": 2, "sql": DDL[2], "status": "success"},
+        ],
+    }
+
+
+def test_summary_partial_failure():
+    result = _summary(DDL, None, [None, errors.SyntaxError("bad syntax")])
+    assert result["status"] == "error"
+    assert result["message"] == "1 of 3 statements executed successfully"
+    assert result["cluster_name"] is None
+    assert result["results"] == [
+        {"statement_index": 0, "sql": DDL[0], "status": "success"},
+        {
+            "statement_index": 1,
+            "sql": DDL[1],
+            "status": "error",
+            "error": "bad syntax",
+        },
+        # Past the end of the outcomes, so it never ran
+        {"statement_index": 2, "sql": DDL[2], "status": "skipped"},
+    ]
+
+
+def test_summary_nothing_ran():
+    result = _summary(DDL, None, [])
+    assert result["status"] == "error"
+    assert result["message"] == "0 of 3 statements executed successfully"
+    assert [r["status"] for r in result["results"]] == ["skipped"] * 3
+
+
+@pytest.mark.asyncio
+async def test_summary_gather_exceptions():
+    async def run(i: int):
+        if i == 1:
+            raise errors.UndefinedTable('unknown catalog item "missing"')
+
+    outcomes = await asyncio.gather(*(run(i) for i in range(3)), return_exceptions=True)
+    result = _summary(DDL, None, outcomes)
+    assert result["status"] == "error"
+    assert result["message"] == "2 of 3 statements executed successfully"
+    assert [r["status"] for r in result["results"]] == ["success", "error", "success"]
+    assert result["results"][1]["error"] == 'unknown catalog item "missing"'
+
+
+@pytest.mark.asyncio
+async def test_pipeline_unsupported_runs_nothing(monkeypatch):
+    monkeypatch.setattr(AsyncPipeline, "is_supported", classmethod(lambda cls: False))
+    # No pool: nothing may be executed when pipelines are unavailable
+    result = await ExecuteDDL(pool=None)(DDL, pipeline=True)
+    assert result["status"] == "error"
+    assert "not supported" in result["message"]
+    assert [r["status"] for r in result["results"]] == ["skipped"] * 3
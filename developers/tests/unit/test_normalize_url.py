@@ -0,0 +1,59 @@
+import pytest
+
+from mcp_materialize_developers.search.doc_search import _normalize_url
+
+
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        # Already canonical
+        (
+            "https://materialize.com/docs/sql/create-view/",
+            "https://materialize.com/docs/sql/create-view/",
+        ),
+        # index.html maps onto its directory
+        (
+            "https://materialize.com/docs/sql/create-view/index.html",
+            "https://materialize.com/docs/sql/create-view/",
+        ),
+        (
+            "https://materialize.com/docs/index.html",
+            "https://materialize.com/docs/",
+        ),
+        # A directory path without its trailing slash
+        (
+            "https://materialize.com/docs/sql/create-view",
+            "https://materialize.com/docs/sql/create-view/",
+        ),
+        # Fragments and query strings are dropped
+        (
+            "https://materialize.com/docs/sql/create-view/#syntax",
+            "https://materialize.com/docs/sql/create-view/",
+        ),
+        (
+            "https://materialize.com/docs/sql/create-view?utm_source=x#syntax",
+            "https://materialize.com/docs/sql/create-view/",
+        ),
+        # Scheme and host are case-insensitive, the path is not
+        (
+            "HTTPS://Materialize.COM/docs/SQL/Create-View/",
+            "https://materialize.com/docs/SQL/Create-View/",
+        ),
+        # Paths naming a file keep their extension and get no slash
+        (
+            "https://materialize.com/docs/images/diagram.svg",
+            "https://materialize.com/docs/images/diagram.svg",
+        ),
+        (
+            "https://materialize.com/docs/sitemap.xml?page=2",
+            "https://materialize.com/docs/sitemap.xml",
+        ),
+    ],
+)
+def test_normalize_url(url, expected):
+    assert _normalize_url(url) == expected
+
+
+def test_normalize_url_is_idempotent():
+    url = _normalize_url("https://Materialize.com/docs/sql/index.html#top")
+    assert _normalize_url(url) == url
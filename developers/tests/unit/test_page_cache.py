@@ -0,0 +1,126 @@
+import pytest
+
+from mcp_materialize_developers.search.doc_search import DocumentationSearcher
+from mcp_materialize_developers.search.page_cache import CachedPage, PageCache
+
+URL = "https://materialize.com/docs/sql/create-view/"
+
+
+def test_page_cache_round_trip(tmp_path):
+    path = str(tmp_path / "pages.sqlite")
+    cache = PageCache(path)
+    assert cache.get(URL) is None
+
+    cache.put(URL, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", "<html>v1</html>")
+    assert cache.get(URL) == CachedPage(
+        '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", "<html>v1</html>"
+    )
+
+    # A newer copy replaces the old one, validators included
+    cache.put(URL, None, "Tue, 02 Jan 2024 00:00:00 GMT", "<html>v2</html>")
+    assert cache.get(URL) == CachedPage(
+        None, "Tue, 02 Jan 2024 00:00:00 GMT", "<html>v2</html>"
+    )
+    cache.close()
+
+    # And it survives reopening the file
+    cache = PageCache(path)
+    assert cache.get(URL).html == "<html>v2</html>"
+    assert cache.get("https://materialize.com/docs/") is None
+    cache.close()
+
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self._body = body
+
+    async def iter_chunked(self, size: int):
+        for start in range(0, len(self._body), size):
+            yield self._body[start : start + size]
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: bytes = b"", headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content_type = "text/html"
+        self.charset = "utf-8"
+        self.url = URL
+        self.content = FakeContent(body)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeSession:
+    """Answers every GET with the given response and records the headers sent."""
+
+    def __init__(self, response: FakeResponse):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None):
+        self.requests.append((url, headers))
+        return self.response
+
+
+def searcher(tmp_path) -> DocumentationSearcher:
+    # The vector store is never touched when fetching pages
+    return DocumentationSearcher(
+        s3_store=object(),
+        page_cache_path=str(tmp_path / "pages.sqlite"),
+        requests_per_second=1000,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_not_modified_returns_cached_html(tmp_path):
+    docs = searcher(tmp_path)
+    docs._page_cache.put(URL, '"v1"', "Mon, 01 Jan 2024 00:00:00 GMT", "<p>cached</p>")
+    session = FakeSession(FakeResponse(304))
+
+    assert await docs._fetch_page(session, URL) == "<p>cached</p>"
+    assert session.requests == [
+        (
+            URL,
+            {
+                "If-None-Match": '"v1"',
+                "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+    ]
+    docs._page_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_ok_stores_new_validators(tmp_path):
+    docs = searcher(tmp_path)
+    docs._page_cache.put(URL, '"v1"', None, "<p>old</p>")
+    session = FakeSession(
+        FakeResponse(
+            200,
+            b"<p>new</p>",
+            {"ETag": '"v2"', "Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"},
+        )
+    )
+
+    assert await docs._fetch_page(session, URL) == "<p>new</p>"
+    assert session.requests == [(URL, {"If-None-Match": '"v1"'})]
+    assert docs._page_cache.get(URL) == CachedPage(
+        '"v2"', "Tue, 02 Jan 2024 00:00:00 GMT", "<p>new</p>"
+    )
+    docs._page_cache.close()
+
+
+@pytest.mark.asyncio
+async def test_fetch_uncached_page_is_unconditional(tmp_path):
+    docs = searcher(tmp_path)
+    session = FakeSession(FakeResponse(200, b"<p>page</p>", {"ETag": '"v1"'}))
+
+    assert await docs._fetch_page(session, URL) == "<p>page</p>"
+    assert session.requests == [(URL, {})]
+    assert docs._page_cache.get(URL) == CachedPage('"v1"', None, "<p>page</p>")
+    docs._page_cache.close()
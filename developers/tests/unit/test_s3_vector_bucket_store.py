@@ -0,0 +1,186 @@
+import asyncio
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from mcp_materialize_developers.search.s3_vector_bucket_store import (
+    _BATCH_TOO_LARGE_ERRORS,
+    LOCAL_INDEX_EMPTY_RETRY_SECONDS,
+    LOCAL_INDEX_TTL_SECONDS,
+    S3VectorBucketStore,
+    _is_batch_too_large,
+)
+
+
+def client_error(code: str, message: str = "", status: int = 400) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "PutVectors",
+    )
+
+
+@pytest.mark.parametrize("code", sorted(_BATCH_TOO_LARGE_ERRORS))
+def test_size_error_codes(code):
+    assert _is_batch_too_large(client_error(code))
+
+
+def test_payload_too_large_status():
+    assert _is_batch_too_large(client_error("UnknownError", status=413))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Request size exceeds the maximum allowed",
+        "The payload size of 25 MB is over the limit",
+        "Batch size must be at most 500",
+        "Too many vectors in a single request",
+    ],
+)
+def test_validation_about_size(message):
+    assert _is_batch_too_large(client_error("ValidationException", message))
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Invalid vector dimension: expected 384, got 768",
+        "Metadata key 'title' must be a string",
+        "",
+    ],
+)
+def test_validation_not_about_size(message):
+    assert not _is_batch_too_large(client_error("ValidationException", message))
+
+
+def test_other_errors():
+    assert not _is_batch_too_large(client_error("AccessDeniedException", status=403))
+    assert not _is_batch_too_large(
+        client_error("ServiceUnavailableException", status=503)
+    )
+
+
+# Deliberately not unit length; the local index normalizes them on load
+VECTORS = [
+    ("a", [1.0, 0.0, 0.0], "sql"),
+    ("b", [3.0, 4.0, 0.0], "sql"),
+    ("c", [0.0, 0.0, 2.0], "concepts"),
+    ("d", [0.0, 1.0, 0.0], "concepts"),
+]
+
+
+class FakeVectorsClient:
+    """Serves VECTORS from ListVectors, two per page."""
+
+    def __init__(self, vectors=VECTORS):
+        self.vectors = vectors
+        self.list_calls = 0
+
+    async def list_vectors(self, **params):
+        self.list_calls += 1
+        start = int(params.get("nextToken", 0))
+        page = self.vectors[start : start + 2]
+        response = {
+            "vectors": [
+                {
+                    "key": key,
+                    "data": {"float32": data},
+                    "metadata": {"url": f"https://docs/{key}/", "section": section},
+                }
+                for key, data, section in page
+            ]
+        }
+        if start + 2 < len(self.vectors):
+            response["nextToken"] = str(start + 2)
+        return response
+
+
+def local_store(client: FakeVectorsClient) -> S3VectorBucketStore:
+    # Skip __init__, which loads the embedding model and talks to AWS
+    store = S3VectorBucketStore.__new__(S3VectorBucketStore)
+    store.bucket_name = "bucket"
+    store.index_name = "index"
+    store.vector_dimensions = 3
+    store._local_index = None
+    store._local_index_expires_at = 0.0
+    store._local_index_lock = asyncio.Lock()
+
+    async def _client():
+        return client
+
+    store._client = _client
+    return store
+
+
+@pytest.mark.asyncio
+async def test_search_local_ranking():
+    store = local_store(FakeVectorsClient())
+
+    # Cosine similarities against (0, 1, 2): c 0.894, d 0.447, b 0.358, a 0
+    results = await store._search_local([0.0, 1.0, 2.0], limit=3)
+    assert [r["url"] for r in results] == [
+        "https://docs/c/",
+        "https://docs/d/",
+        "https://docs/b/",
+    ]
+    assert [r["id"] for r in results] == [0, 1, 2]
+    assert [r["similarity"] for r in results] == pytest.approx(
+        [2 / 5**0.5, 1 / 5**0.5, 0.8 / 5**0.5], rel=1e-6
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_local_limit_and_filter():
+    store = local_store(FakeVectorsClient())
+
+    results = await store._search_local([2.0, 0.0, 0.0], limit=1)
+    assert [(r["url"], r["similarity"]) for r in results] == [
+        ("https://docs/a/", pytest.approx(1.0))
+    ]
+
+    # A limit past the number of vectors returns them all
+    results = await store._search_local([0.0, 1.0, 2.0], limit=10)
+    assert len(results) == len(VECTORS)
+
+    results = await store._search_local([0.0, 1.0, 2.0], 5, section_filter="sql")
+    assert [r["url"] for r in results] == ["https://docs/b/", "https://docs/a/"]
+    assert all(r["section"] == "sql" for r in results)
+
+    assert await store._search_local([1.0, 0.0, 0.0], 5, section_filter="none") == []
+
+
+@pytest.mark.asyncio
+async def test_local_index_reloads_once_expired():
+    client = FakeVectorsClient()
+    store = local_store(client)
+
+    await store._search_local([1.0, 0.0, 0.0], limit=1)
+    # Two pages of two vectors each
+    assert client.list_calls == 2
+    assert store._local_index_expires_at > time.monotonic() + (
+        LOCAL_INDEX_TTL_SECONDS - 60
+    )
+
+    # Still fresh: served from memory
+    await store._search_local([1.0, 0.0, 0.0], limit=1)
+    assert client.list_calls == 2
+
+    store._local_index_expires_at = 0.0
+    await store._search_local([1.0, 0.0, 0.0], limit=1)
+    assert client.list_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_empty_local_index_retries_soon():
+    client = FakeVectorsClient(vectors=[])
+    store = local_store(client)
+
+    assert await store._search_local([1.0, 0.0, 0.0], limit=5) == []
+    assert (
+        store._local_index_expires_at
+        <= time.monotonic() + LOCAL_INDEX_EMPTY_RETRY_SECONDS
+    )